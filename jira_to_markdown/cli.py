@@ -6,22 +6,55 @@ import sys
 import os
 import click
 import logging
-from pathlib import Path
+from functools import partial
+from operator import itemgetter
+from typing import TYPE_CHECKING
 
 from .config import Config, ConfigurationError
 from .logger import setup_logger
-from .jira_client import JiraClient, JiraConnectionError, JiraAuthenticationError, TicketNotFoundError
-from .ticket_fetcher import TicketFetcher
-from .markdown_converter import MarkdownConverter
-from .file_writer import FileWriter, FileWriteError
+
+# The JIRA client stack (jira, requests, urllib3) and the converter modules
+# are imported inside the commands that need them so that --help and
+# shell completion don't pay for them.
+if TYPE_CHECKING:
+    from .jira_client import JiraClient
 
 
 # Global context for sharing configuration
 class Context:
+    __slots__ = ('config', 'verbose', 'refresh_fields', '_client', '_logger', '_logger_factory')
+
     def __init__(self):
         self.config = None
-        self.logger = None
         self.verbose = False
+        self.refresh_fields = False
+        self._client = None
+        self._logger = None
+        self._logger_factory = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        """
+        Application logger, configured on first use.
+
+        Setting up handlers creates the log directory and opens the log
+        file, which --help and usage errors never need.
+        """
+        if self._logger is None:
+            self._logger = self._logger_factory()
+        return self._logger
+
+    @property
+    def client(self) -> 'JiraClient':
+        """Connected JIRA client, created on first use and shared by all commands."""
+        if self._client is None:
+            self._client = _make_client(self.config, refresh_fields=self.refresh_fields)
+        return self._client
+
+    @property
+    def jira_session(self):
+        """Session of the JIRA client if one is already connected, else None."""
+        return self._client.session if self._client is not None else None
 
 
 @click.group()
@@ -31,8 +64,9 @@ class Context:
 @click.option('--jira-url', help='JIRA instance URL (overrides config)')
 @click.option('--username', help='JIRA username (overrides config)')
 @click.option('--api-token', help='JIRA API token (overrides config)')
+@click.option('--refresh-fields', is_flag=True, help='Refetch custom field names instead of using the cache')
 @click.pass_context
-def cli(ctx, config, verbose, jira_url, username, api_token):
+def cli(ctx, config, verbose, jira_url, username, api_token, refresh_fields):
     """
     JIRA to Markdown Converter
 
@@ -40,6 +74,7 @@ def cli(ctx, config, verbose, jira_url, username, api_token):
     """
     ctx.obj = Context()
     ctx.obj.verbose = verbose
+    ctx.obj.refresh_fields = refresh_fields
 
     # Load configuration
     try:
@@ -64,7 +99,8 @@ def cli(ctx, config, verbose, jira_url, username, api_token):
         file_log_level = getattr(logging, ctx.obj.config.log_level.upper(), logging.INFO)
         console_log_level = log_level
 
-        ctx.obj.logger = setup_logger(
+        ctx.obj._logger_factory = partial(
+            setup_logger,
             'jira_to_markdown',
             log_file=ctx.obj.config.log_file,
             file_level=file_log_level,
@@ -91,33 +127,28 @@ def test_connection(ctx):
 
     Verifies that the credentials and JIRA URL are correct.
     """
+    from .jira_client import JiraConnectionError, JiraAuthenticationError
+
     config = ctx.obj.config
     logger = ctx.obj.logger
 
     try:
         click.echo("Testing JIRA connection...")
 
-        client = JiraClient(
-            url=config.jira_url,
-            username=config.jira_username,
-            api_token=config.jira_api_token,
-            verify_ssl=config.jira_verify_ssl
-        )
-
-        client.connect()
+        client = ctx.obj.client
         client.test_connection()
 
-        click.echo(click.style("✓ Connection successful!", fg='green'))
+        click.secho("✓ Connection successful!", fg='green')
         click.echo(f"Connected to: {config.jira_url}")
 
     except JiraAuthenticationError as e:
-        click.echo(click.style(f"✗ Authentication failed: {e}", fg='red'), err=True)
+        click.secho(f"✗ Authentication failed: {e}", fg='red', err=True)
         sys.exit(1)
     except JiraConnectionError as e:
-        click.echo(click.style(f"✗ Connection failed: {e}", fg='red'), err=True)
+        click.secho(f"✗ Connection failed: {e}", fg='red', err=True)
         sys.exit(1)
     except Exception as e:
-        click.echo(click.style(f"✗ Error: {e}", fg='red'), err=True)
+        click.secho(f"✗ Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
@@ -126,13 +157,19 @@ def test_connection(ctx):
 @click.option('--output', '-o', help='Output directory (overrides config)')
 @click.option('--overwrite', is_flag=True, help='Overwrite existing files')
 @click.option('--download-images', 'download_imgs', is_flag=True, help='Download images after conversion')
+@click.option('--image-workers', type=click.IntRange(min=1), default=8, help='Number of concurrent image downloads (default: 8)')
 @click.pass_context
-def fetch(ctx, ticket_key, output, overwrite, download_imgs):
+def fetch(ctx, ticket_key, output, overwrite, download_imgs, image_workers):
     """
     Fetch a single JIRA ticket and convert to Markdown.
 
     TICKET_KEY: The JIRA ticket key (e.g., PROJ-123)
     """
+    from .jira_client import JiraConnectionError, JiraAuthenticationError, TicketNotFoundError
+    from .ticket_fetcher import TicketFetcher
+    from .markdown_converter import MarkdownConverter
+    from .file_writer import FileWriter, FileWriteError
+
     config = ctx.obj.config
     logger = ctx.obj.logger
 
@@ -142,46 +179,45 @@ def fetch(ctx, ticket_key, output, overwrite, download_imgs):
         if overwrite:
             config.set('output.overwrite', True)
 
-        click.echo(f"Fetching ticket {ticket_key}...")
+        writer = FileWriter(output_dir, overwrite=config.output_overwrite, fsync=config.output_fsync)
 
-        # Initialize components
-        client = JiraClient(
-            url=config.jira_url,
-            username=config.jira_username,
-            api_token=config.jira_api_token,
-            verify_ssl=config.jira_verify_ssl
-        )
-        client.connect()
+        # Nothing would be written, so don't fetch (or even connect)
+        if not writer.overwrite and writer.file_exists(ticket_key):
+            click.secho(f"{ticket_key} already exported to {output_dir} (use --overwrite to replace)",
+                        fg='yellow')
+        else:
+            click.echo(f"Fetching ticket {ticket_key}...")
 
-        fetcher = TicketFetcher(client)
-        converter = MarkdownConverter(config)
-        writer = FileWriter(output_dir, overwrite=config.output_overwrite)
+            # Initialize components
+            fetcher = TicketFetcher(ctx.obj.client)
+            converter = MarkdownConverter(config)
 
-        # Fetch and convert
-        ticket_data = fetcher.fetch_single(ticket_key)
-        markdown = converter.convert(ticket_data)
+            # Fetch and convert
+            ticket_data = fetcher.fetch_single(ticket_key)
+            markdown = converter.convert(ticket_data)
 
-        # Write to file
-        filepath = writer.write_ticket(ticket_key, markdown, ticket_data)
+            # Write to file
+            filepath = writer.write_ticket(ticket_key, markdown, ticket_data)
+            writer.close()
 
-        click.echo(click.style(f"✓ Successfully written to {filepath}", fg='green'))
+            click.secho(f"✓ Successfully written to {filepath}", fg='green')
 
         # Download images if requested
         if download_imgs or config.images_download:
-            _run_image_download(ctx, output_dir)
+            _run_image_download(ctx, output_dir, workers=image_workers)
 
     except TicketNotFoundError as e:
-        click.echo(click.style(f"✗ {e}", fg='red'), err=True)
+        click.secho(f"✗ {e}", fg='red', err=True)
         sys.exit(1)
     except (JiraConnectionError, JiraAuthenticationError) as e:
-        click.echo(click.style(f"✗ JIRA error: {e}", fg='red'), err=True)
+        click.secho(f"✗ JIRA error: {e}", fg='red', err=True)
         sys.exit(1)
     except FileWriteError as e:
-        click.echo(click.style(f"✗ File write error: {e}", fg='red'), err=True)
+        click.secho(f"✗ File write error: {e}", fg='red', err=True)
         sys.exit(1)
     except Exception as e:
-        logger.exception("Unexpected error")
-        click.echo(click.style(f"✗ Error: {e}", fg='red'), err=True)
+        logger.error("Unexpected error: %s", e, exc_info=ctx.obj.verbose)
+        click.secho(f"✗ Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
@@ -191,13 +227,20 @@ def fetch(ctx, ticket_key, output, overwrite, download_imgs):
 @click.option('--output', '-o', help='Output directory (overrides config)')
 @click.option('--overwrite', is_flag=True, help='Overwrite existing files')
 @click.option('--download-images', 'download_imgs', is_flag=True, help='Download images after conversion')
+@click.option('--image-workers', type=click.IntRange(min=1), default=8, help='Number of concurrent image downloads (default: 8)')
+@click.option('--concurrency', '-j', type=click.IntRange(min=1), help='Number of tickets processed in parallel (overrides config)')
 @click.pass_context
-def query(ctx, jql_query, max_results, output, overwrite, download_imgs):
+def query(ctx, jql_query, max_results, output, overwrite, download_imgs, image_workers, concurrency):
     """
     Fetch tickets using JQL query and convert to Markdown.
 
     JQL_QUERY: JIRA Query Language string (e.g., "project = PROJ")
     """
+    from .jira_client import JiraConnectionError, JiraAuthenticationError
+    from .ticket_fetcher import TicketFetcher
+    from .markdown_converter import MarkdownConverter
+    from .file_writer import FileWriter
+
     config = ctx.obj.config
     logger = ctx.obj.logger
 
@@ -206,55 +249,57 @@ def query(ctx, jql_query, max_results, output, overwrite, download_imgs):
         output_dir = output or config.output_directory
         if overwrite:
             config.set('output.overwrite', True)
+        # Must be set before the client is built; it sizes the HTTP pool
+        if concurrency:
+            config.set('jira.concurrency', concurrency)
 
         click.echo(f"Searching with JQL: {jql_query}")
 
         # Initialize components
-        client = JiraClient(
-            url=config.jira_url,
-            username=config.jira_username,
-            api_token=config.jira_api_token,
-            verify_ssl=config.jira_verify_ssl
-        )
-        client.connect()
-
-        fetcher = TicketFetcher(client)
+        fetcher = TicketFetcher(ctx.obj.client)
         converter = MarkdownConverter(config)
-        writer = FileWriter(output_dir, overwrite=config.output_overwrite)
+        writer = FileWriter(output_dir, overwrite=config.output_overwrite, fsync=config.output_fsync)
 
-        # Fetch tickets
-        tickets = fetcher.fetch_by_jql(jql_query, max_results=max_results)
+        # Fetch tickets page by page; later pages are requested while
+        # earlier tickets are being converted and written
+        total, tickets = fetcher.stream_by_jql(jql_query, max_results=max_results)
 
-        if not tickets:
+        if not total:
             click.echo("No tickets found matching the query.")
             return
 
-        click.echo(f"Found {len(tickets)} ticket(s). Converting to Markdown...")
+        click.echo(f"Found {total} ticket(s). Converting to Markdown...")
 
-        # Process with progress bar
-        with click.progressbar(tickets, label='Processing tickets') as bar:
-            success_count = 0
-            for ticket_data in bar:
-                try:
-                    markdown = converter.convert(ticket_data)
-                    writer.write_ticket(ticket_data['key'], markdown, ticket_data)
-                    success_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to process {ticket_data.get('key', 'unknown')}: {e}")
+        skip_existing = not writer.overwrite
 
-        click.echo(click.style(f"✓ Successfully processed {success_count}/{len(tickets)} tickets", fg='green'))
+        def process_ticket(ticket_data):
+            if skip_existing and writer.file_exists(ticket_data['key']):
+                logger.info("Skipping %s: already exported", ticket_data['key'])
+                return
+            markdown = converter.convert(ticket_data)
+            writer.write_ticket(ticket_data['key'], markdown, ticket_data)
+
+        jobs = ((ticket_data.get('key', 'unknown'), ticket_data) for ticket_data in tickets)
+        try:
+            success_count, ticket_count = _process_concurrently(
+                jobs, total, process_ticket, config.jira_concurrency, logger
+            )
+        finally:
+            writer.close()
+
+        click.secho(f"✓ Successfully processed {success_count}/{ticket_count} tickets", fg='green')
         click.echo(f"Output directory: {output_dir}")
 
         # Download images if requested
         if download_imgs or config.images_download:
-            _run_image_download(ctx, output_dir)
+            _run_image_download(ctx, output_dir, workers=image_workers)
 
     except (JiraConnectionError, JiraAuthenticationError) as e:
-        click.echo(click.style(f"✗ JIRA error: {e}", fg='red'), err=True)
+        click.secho(f"✗ JIRA error: {e}", fg='red', err=True)
         sys.exit(1)
     except Exception as e:
-        logger.exception("Unexpected error")
-        click.echo(click.style(f"✗ Error: {e}", fg='red'), err=True)
+        logger.error("Unexpected error: %s", e, exc_info=ctx.obj.verbose)
+        click.secho(f"✗ Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
@@ -264,8 +309,10 @@ def query(ctx, jql_query, max_results, output, overwrite, download_imgs):
 @click.option('--output', '-o', help='Output directory (overrides config)')
 @click.option('--overwrite', is_flag=True, help='Overwrite existing files')
 @click.option('--download-images', 'download_imgs', is_flag=True, help='Download images after conversion')
+@click.option('--image-workers', type=click.IntRange(min=1), default=8, help='Number of concurrent image downloads (default: 8)')
+@click.option('--concurrency', '-j', type=click.IntRange(min=1), help='Number of tickets processed in parallel (overrides config)')
 @click.pass_context
-def bulk(ctx, ticket_keys, file, output, overwrite, download_imgs):
+def bulk(ctx, ticket_keys, file, output, overwrite, download_imgs, image_workers, concurrency):
     """
     Fetch multiple specific tickets and convert to Markdown.
 
@@ -273,17 +320,26 @@ def bulk(ctx, ticket_keys, file, output, overwrite, download_imgs):
 
     Use --file to read ticket keys from a file instead.
     """
+    from .jira_client import JiraConnectionError, JiraAuthenticationError
+    from .ticket_fetcher import TicketFetcher
+    from .markdown_converter import MarkdownConverter
+    from .file_writer import FileWriter
+
     config = ctx.obj.config
     logger = ctx.obj.logger
 
     try:
-        # Get ticket keys from file or arguments
-        keys = list(ticket_keys)
-
-        if file:
-            with open(file, 'r') as f:
-                file_keys = [line.strip() for line in f if line.strip()]
-                keys.extend(file_keys)
+        # Get ticket keys from arguments and file, read line by line
+        def iter_keys():
+            yield from ticket_keys
+            if file:
+                with open(file, 'r') as f:
+                    for line in f:
+                        yield from line.split()
+
+        # Remove duplicates while preserving order; only unique keys are
+        # kept, since the count is needed up front for the progress bar
+        keys = list(dict.fromkeys(iter_keys()))
 
         if not keys:
             click.echo("Error: No ticket keys provided.", err=True)
@@ -291,56 +347,53 @@ def bulk(ctx, ticket_keys, file, output, overwrite, download_imgs):
             click.echo("Or:  jira-to-md bulk --file tickets.txt")
             sys.exit(1)
 
-        # Remove duplicates while preserving order
-        keys = list(dict.fromkeys(keys))
-
         # Override output directory if specified
         output_dir = output or config.output_directory
         if overwrite:
             config.set('output.overwrite', True)
+        # Must be set before the client is built; it sizes the HTTP pool
+        if concurrency:
+            config.set('jira.concurrency', concurrency)
 
         click.echo(f"Fetching {len(keys)} ticket(s)...")
 
         # Initialize components
-        client = JiraClient(
-            url=config.jira_url,
-            username=config.jira_username,
-            api_token=config.jira_api_token,
-            verify_ssl=config.jira_verify_ssl
-        )
-        client.connect()
-
-        fetcher = TicketFetcher(client)
+        fetcher = TicketFetcher(ctx.obj.client)
         converter = MarkdownConverter(config)
-        writer = FileWriter(output_dir, overwrite=config.output_overwrite)
-
-        # Process with progress bar
-        with click.progressbar(keys, label='Processing tickets') as bar:
-            success_count = 0
-            for key in bar:
-                try:
-                    ticket_data = fetcher.fetch_single(key)
-                    markdown = converter.convert(ticket_data)
-                    writer.write_ticket(key, markdown, ticket_data)
-                    success_count += 1
-                except TicketNotFoundError:
-                    logger.error(f"Ticket {key} not found")
-                except Exception as e:
-                    logger.error(f"Failed to process {key}: {e}")
-
-        click.echo(click.style(f"✓ Successfully processed {success_count}/{len(keys)} tickets", fg='green'))
+        writer = FileWriter(output_dir, overwrite=config.output_overwrite, fsync=config.output_fsync)
+
+        skip_existing = not writer.overwrite
+
+        def process_key(key):
+            # Already exported tickets cost no API call unless overwriting
+            if skip_existing and writer.file_exists(key):
+                logger.info("Skipping %s: already exported", key)
+                return
+            ticket_data = fetcher.fetch_single(key)
+            markdown = converter.convert(ticket_data)
+            writer.write_ticket(key, markdown, ticket_data)
+
+        jobs = ((key, key) for key in keys)
+        try:
+            success_count, _ = _process_concurrently(
+                jobs, len(keys), process_key, config.jira_concurrency, logger
+            )
+        finally:
+            writer.close()
+
+        click.secho(f"✓ Successfully processed {success_count}/{len(keys)} tickets", fg='green')
         click.echo(f"Output directory: {output_dir}")
 
         # Download images if requested
         if download_imgs or config.images_download:
-            _run_image_download(ctx, output_dir)
+            _run_image_download(ctx, output_dir, workers=image_workers)
 
     except (JiraConnectionError, JiraAuthenticationError) as e:
-        click.echo(click.style(f"✗ JIRA error: {e}", fg='red'), err=True)
+        click.secho(f"✗ JIRA error: {e}", fg='red', err=True)
         sys.exit(1)
     except Exception as e:
-        logger.exception("Unexpected error")
-        click.echo(click.style(f"✗ Error: {e}", fg='red'), err=True)
+        logger.error("Unexpected error: %s", e, exc_info=ctx.obj.verbose)
+        click.secho(f"✗ Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
@@ -353,21 +406,14 @@ def list_fields(ctx):
     This helps you identify which custom fields are available
     for your JIRA instance.
     """
-    config = ctx.obj.config
+    from .jira_client import JiraConnectionError, JiraAuthenticationError
+
     logger = ctx.obj.logger
 
     try:
         click.echo("Fetching custom fields from JIRA...")
 
-        client = JiraClient(
-            url=config.jira_url,
-            username=config.jira_username,
-            api_token=config.jira_api_token,
-            verify_ssl=config.jira_verify_ssl
-        )
-        client.connect()
-
-        custom_fields = client.get_custom_fields()
+        custom_fields = ctx.obj.client.get_custom_fields()
 
         if not custom_fields:
             click.echo("No custom fields found.")
@@ -375,16 +421,18 @@ def list_fields(ctx):
 
         click.echo(f"\nFound {len(custom_fields)} custom fields:\n")
 
-        # Display in a formatted table
-        for field_id, field_name in sorted(custom_fields.items(), key=lambda x: x[1]):
-            click.echo(f"  {field_id:20s} → {field_name}")
+        # Display in a formatted table, written in one go
+        click.echo("\n".join(
+            f"  {field_id:20s} → {field_name}"
+            for field_id, field_name in sorted(custom_fields.items(), key=itemgetter(1))
+        ))
 
     except (JiraConnectionError, JiraAuthenticationError) as e:
-        click.echo(click.style(f"✗ JIRA error: {e}", fg='red'), err=True)
+        click.secho(f"✗ JIRA error: {e}", fg='red', err=True)
         sys.exit(1)
     except Exception as e:
-        logger.exception("Unexpected error")
-        click.echo(click.style(f"✗ Error: {e}", fg='red'), err=True)
+        logger.error("Unexpected error: %s", e, exc_info=ctx.obj.verbose)
+        click.secho(f"✗ Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
@@ -392,8 +440,9 @@ def list_fields(ctx):
 @click.option('--directory', '-d', help='Directory containing markdown files (default: output directory)')
 @click.option('--images-dir', '-i', help='Directory to save images (default: {output}/images)')
 @click.option('--dry-run', is_flag=True, help='Show what would be downloaded without downloading')
+@click.option('--image-workers', type=click.IntRange(min=1), default=8, help='Number of concurrent image downloads (default: 8)')
 @click.pass_context
-def download_images(ctx, directory, images_dir, dry_run):
+def download_images(ctx, directory, images_dir, dry_run, image_workers):
     """
     Download images from markdown files.
 
@@ -406,103 +455,198 @@ def download_images(ctx, directory, images_dir, dry_run):
     logger = ctx.obj.logger
 
     try:
-        from .image_downloader import ImageDownloader
-
         output_dir = directory or config.output_directory
         if images_dir is None:
-            images_dir = config.get('images.directory', os.path.join(output_dir, 'images'))
+            images_dir = config.get('images.directory') or os.path.join(output_dir, 'images')
 
         click.echo(f"Scanning markdown files in: {output_dir}")
         click.echo(f"Images will be saved to: {images_dir}")
 
         if dry_run:
-            click.echo(click.style("(Dry run - no files will be modified)", fg='yellow'))
-
-        downloader = ImageDownloader(
-            output_dir=output_dir,
-            images_dir=images_dir,
-            jira_url=config.jira_url,
-            jira_username=config.jira_username,
-            jira_api_token=config.jira_api_token,
-            verify_ssl=config.jira_verify_ssl
-        )
+            click.secho("(Dry run - no files will be modified)", fg='yellow')
+
+        downloader = _make_image_downloader(ctx, output_dir, images_dir)
 
         if dry_run:
-            md_files = list(Path(output_dir).glob('*.md'))
-            total_images = 0
+            from collections import Counter
 
-            for md_file in md_files:
-                content = md_file.read_text(encoding='utf-8')
-                images = downloader._find_images(content)
-                remote_images = [img for img in images if img.url.startswith(('http://', 'https://'))]
-                if remote_images:
-                    click.echo(f"  {md_file.name}: {len(remote_images)} remote image(s)")
-                    total_images += len(remote_images)
-
-            click.echo(f"\nTotal: {total_images} remote images found in {len(md_files)} files")
-            return
+            md_files = downloader.find_markdown_files()
 
-        results = downloader.process_directory()
+            url_map = downloader.collect_remote_images(md_files, max_workers=image_workers)
+            counts = Counter(md_file for refs in url_map.values() for md_file, _ in refs)
 
-        total_found = sum(r['images_found'] for r in results.values())
-        total_downloaded = sum(r['images_downloaded'] for r in results.values())
-        total_failed = sum(r['images_failed'] for r in results.values())
-        total_skipped = sum(r['images_skipped'] for r in results.values())
+            for md_file in md_files:
+                if counts[md_file]:
+                    click.echo(f"  {md_file.name}: {counts[md_file]} remote image(s)")
 
-        click.echo("")
-        click.echo(click.style("Summary:", bold=True))
-        click.echo(f"  Files processed: {len(results)}")
-        click.echo(f"  Images found: {total_found}")
-        click.echo(click.style(f"  Images downloaded: {total_downloaded}", fg='green'))
-        if total_skipped:
-            click.echo(f"  Images skipped (local): {total_skipped}")
-        if total_failed:
-            click.echo(click.style(f"  Images failed: {total_failed}", fg='red'))
+            total_images = sum(counts.values())
+            click.echo(f"\nTotal: {total_images} remote images found in {len(md_files)} files "
+                       f"({len(url_map)} unique to download)")
+            return
+
+        with downloader:
+            results = downloader.process_directory(max_workers=image_workers)
 
+        total_found = total_downloaded = total_failed = total_skipped = 0
         all_errors = []
         for filename, result in results.items():
+            total_found += result['images_found']
+            total_downloaded += result['images_downloaded']
+            total_failed += result['images_failed']
+            total_skipped += result['images_skipped']
             for error in result.get('errors', []):
                 all_errors.append(f"  {filename}: {error}")
 
+        # Build the report up front and write it in one go; click.echo
+        # strips the styling when stdout is not a terminal
+        out = [
+            "",
+            click.style("Summary:", bold=True),
+            f"  Files processed: {len(results)}",
+            f"  Images found: {total_found}",
+            click.style(f"  Images downloaded: {total_downloaded}", fg='green'),
+        ]
+        if total_skipped:
+            out.append(f"  Images skipped (local): {total_skipped}")
+        if total_failed:
+            out.append(click.style(f"  Images failed: {total_failed}", fg='red'))
+
         if all_errors and ctx.obj.verbose:
-            click.echo(click.style("\nErrors:", fg='red'))
-            for error in all_errors[:10]:
-                click.echo(error)
+            out.append(click.style("\nErrors:", fg='red'))
+            out.extend(all_errors[:10])
             if len(all_errors) > 10:
-                click.echo(f"  ... and {len(all_errors) - 10} more errors")
+                out.append(f"  ... and {len(all_errors) - 10} more errors")
+
+        click.echo("\n".join(out))
 
     except Exception as e:
-        logger.exception("Unexpected error")
-        click.echo(click.style(f"✗ Error: {e}", fg='red'), err=True)
+        logger.error("Unexpected error: %s", e, exc_info=ctx.obj.verbose)
+        click.secho(f"✗ Error: {e}", fg='red', err=True)
         sys.exit(1)
 
 
-def _run_image_download(ctx, output_dir: str):
-    """Helper to run image download post-processor."""
-    from .image_downloader import ImageDownloader
+def _process_concurrently(jobs, length: int, worker, max_workers: int, logger) -> tuple:
+    """
+    Run a worker over tickets on a thread pool while driving a progress bar.
+
+    Fetching is I/O-bound, so overlapping requests cuts wall-time roughly
+    by the number of workers. Jobs are consumed lazily and only a bounded
+    number are in flight, so a streaming source keeps producing while
+    earlier tickets are processed. Failures are logged per ticket and skipped.
+
+    Args:
+        jobs: Iterable of (ticket_key, item) tuples; item is passed to worker
+        length: Expected number of jobs (for the progress bar)
+        worker: Callable processing a single item
+        max_workers: Number of worker threads
+        logger: Logger for per-ticket failures
+
+    Returns:
+        Tuple of (tickets processed successfully, tickets attempted)
+    """
+    from concurrent.futures import ThreadPoolExecutor, ALL_COMPLETED, FIRST_COMPLETED, wait
+    from .jira_client import TicketNotFoundError
+
+    max_workers = max(1, max_workers)
+    success_count = 0
+    job_count = 0
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            click.progressbar(length=length, label='Processing tickets',
+                              update_min_steps=max(1, length // 100)) as bar:
+
+        def drain(return_when):
+            nonlocal success_count
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    future.result()
+                    success_count += 1
+                except TicketNotFoundError:
+                    logger.error("Ticket %s not found", key)
+                except Exception as e:
+                    logger.error("Failed to process %s: %s", key, e)
+                bar.update(1)
 
-    config = ctx.obj.config
-    images_dir = config.get('images.directory', os.path.join(output_dir, 'images'))
+        for key, item in jobs:
+            pending[executor.submit(worker, item)] = key
+            job_count += 1
+            if len(pending) >= max_workers * 2:
+                drain(FIRST_COMPLETED)
+
+        if pending:
+            drain(ALL_COMPLETED)
+
+    return success_count, job_count
 
-    click.echo("\nDownloading images...")
 
-    downloader = ImageDownloader(
+def _make_client(config: Config, refresh_fields: bool = False) -> 'JiraClient':
+    """
+    Build and connect a JIRA client from configuration.
+
+    Args:
+        config: Loaded configuration
+        refresh_fields: Ignore the cached custom field mapping
+
+    Returns:
+        Connected JiraClient
+    """
+    from .jira_client import JiraClient
+
+    client = JiraClient(
+        url=config.jira_url,
+        username=config.jira_username,
+        api_token=config.jira_api_token,
+        verify_ssl=config.jira_verify_ssl,
+        pool_maxsize=max(config.jira_concurrency, 32),
+        cache_dir=config.cache_directory,
+        fields_cache_ttl=0 if refresh_fields else config.cache_fields_ttl
+    )
+    client.connect()
+    return client
+
+
+def _make_image_downloader(ctx, output_dir: str, images_dir: str):
+    """
+    Build an ImageDownloader authenticated with the configured JIRA credentials.
+
+    If this invocation already connected to JIRA, attachment downloads reuse
+    that session's pooled connections instead of opening new ones.
+    """
+    from .image_downloader import ImageDownloader
+
+    config = ctx.obj.config
+    return ImageDownloader(
         output_dir=output_dir,
         images_dir=images_dir,
         jira_url=config.jira_url,
         jira_username=config.jira_username,
         jira_api_token=config.jira_api_token,
-        verify_ssl=config.jira_verify_ssl
+        verify_ssl=config.jira_verify_ssl,
+        jira_session=ctx.obj.jira_session
     )
 
-    results = downloader.process_directory()
-    total_downloaded = sum(r['images_downloaded'] for r in results.values())
-    total_failed = sum(r['images_failed'] for r in results.values())
+
+def _run_image_download(ctx, output_dir: str, workers: int = 1):
+    """Helper to run image download post-processor."""
+    config = ctx.obj.config
+    images_dir = config.get('images.directory') or os.path.join(output_dir, 'images')
+
+    click.echo("\nDownloading images...")
+
+    with _make_image_downloader(ctx, output_dir, images_dir) as downloader:
+        results = downloader.process_directory(max_workers=workers)
+    total_downloaded = total_failed = 0
+    for result in results.values():
+        total_downloaded += result['images_downloaded']
+        total_failed += result['images_failed']
 
     if total_downloaded > 0:
-        click.echo(click.style(f"  Downloaded {total_downloaded} image(s)", fg='green'))
+        click.secho(f"  Downloaded {total_downloaded} image(s)", fg='green')
     if total_failed > 0:
-        click.echo(click.style(f"  Failed: {total_failed} image(s)", fg='yellow'))
+        click.secho(f"  Failed: {total_failed} image(s)", fg='yellow')
 
 
 def main():
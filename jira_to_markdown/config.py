@@ -3,9 +3,62 @@ Configuration management for JIRA to Markdown converter.
 """
 
 import os
-import yaml
+import copy
+from collections import OrderedDict
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Parsed YAML files keyed by real path, with the mtime and size they were
+# parsed at so an edited file is picked up again
+_YAML_CACHE: 'OrderedDict[str, Tuple[int, int, Dict[str, Any]]]' = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+_MISSING = object()
+
+# Built-in configuration, used when no config file is given
+_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    'jira': {
+        'url': '',
+        'username': '',
+        'api_token': '',
+        'verify_ssl': True,
+        'concurrency': 8
+    },
+    'query': {
+        'jql': 'project = PROJ ORDER BY created DESC',
+        'max_results': 100,
+        'fields': '*all'
+    },
+    'output': {
+        'directory': './output',
+        'filename_format': '{key}.md',
+        'overwrite': False,
+        'fsync': False
+    },
+    'markdown': {
+        'include_metadata_table': True,
+        'include_comments': True,
+        'include_attachments': True,
+        'include_subtasks': True,
+        'include_links': True,
+        'date_format': '%Y-%m-%d %H:%M:%S',
+        'convert_markup': True
+    },
+    'logging': {
+        'level': 'INFO',
+        'file': './logs/jira_to_markdown.log',
+        'console': True,
+        'console_level': 'INFO'
+    },
+    'images': {
+        'download': False,
+        'directory': './output/images'
+    },
+    'cache': {
+        'directory': '~/.cache/jira_to_markdown',
+        'fields_ttl': 3600
+    }
+}
 
 
 class ConfigurationError(Exception):
@@ -16,6 +69,8 @@ class ConfigurationError(Exception):
 class Config:
     """Configuration manager that loads and validates settings."""
 
+    __slots__ = ('_config', '_lookups')
+
     def __init__(self, config_file: Optional[str] = None, load_env: bool = True):
         """
         Initialize configuration.
@@ -25,6 +80,8 @@ class Config:
             load_env: Whether to load .env file
         """
         self._config = {}
+        # Resolved dotted-key lookups; cleared whenever set() changes a value
+        self._lookups: Dict[str, Any] = {}
 
         # Load environment variables from .env file
         if load_env:
@@ -45,53 +102,43 @@ class Config:
 
     def _load_yaml(self, config_file: str):
         """Load configuration from YAML file."""
+        # Imported here so runs configured purely through environment
+        # variables never pay for loading PyYAML
+        import yaml
+
+        # The libyaml-backed loader is much faster but only present when
+        # PyYAML was built against libyaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
         try:
-            with open(config_file, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
+            path = os.path.realpath(config_file)
+            stat = os.stat(path)
+
+            cached = _YAML_CACHE.get(path)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                _YAML_CACHE.move_to_end(path)
+                # Copied because environment overrides are written into it
+                self._config = copy.deepcopy(cached[2])
+                return
+
+            with open(path, 'r') as f:
+                self._config = yaml.load(f, Loader=loader) or {}
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Error parsing YAML config: {e}")
         except Exception as e:
             raise ConfigurationError(f"Error loading config file: {e}")
 
+        _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(self._config))
+        _YAML_CACHE.move_to_end(path)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+
     def _set_defaults(self):
         """Set default configuration values."""
-        self._config = {
-            'jira': {
-                'url': '',
-                'username': '',
-                'api_token': '',
-                'verify_ssl': True
-            },
-            'query': {
-                'jql': 'project = PROJ ORDER BY created DESC',
-                'max_results': 100,
-                'fields': '*all'
-            },
-            'output': {
-                'directory': './output',
-                'filename_format': '{key}.md',
-                'overwrite': False
-            },
-            'markdown': {
-                'include_metadata_table': True,
-                'include_comments': True,
-                'include_attachments': True,
-                'include_subtasks': True,
-                'include_links': True,
-                'date_format': '%Y-%m-%d %H:%M:%S',
-                'convert_markup': True
-            },
-            'logging': {
-                'level': 'INFO',
-                'file': './logs/jira_to_markdown.log',
-                'console': True,
-                'console_level': 'INFO'
-            },
-            'images': {
-                'download': False,
-                'directory': './output/images'
-            }
-        }
+        # Every leaf is immutable, so copying each section is enough to keep
+        # _DEFAULTS untouched by set() and overrides (and is much cheaper
+        # than a deepcopy)
+        self._config = {section: dict(values) for section, values in _DEFAULTS.items()}
 
     def _load_env_overrides(self):
         """Override config with environment variables."""
@@ -136,16 +183,22 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
+        value = self._lookups.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._lookups[key] = self._lookup(key)
+
+        return default if value is None else value
+
+    def _lookup(self, key: str) -> Any:
+        """Walk the nested config for a dotted key, returning None if absent."""
         value = self._config
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
+        for k in key.split('.'):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(k)
+            if value is None:
+                return None
 
         return value
 
@@ -166,6 +219,7 @@ class Config:
             config = config[k]
 
         config[keys[-1]] = value
+        self._lookups.clear()
 
     @property
     def jira_url(self) -> str:
@@ -187,6 +241,11 @@ class Config:
         """Get SSL verification setting."""
         return self.get('jira.verify_ssl', True)
 
+    @property
+    def jira_concurrency(self) -> int:
+        """Get number of tickets processed in parallel."""
+        return self.get('jira.concurrency', 8)
+
     @property
     def output_directory(self) -> str:
         """Get output directory."""
@@ -202,6 +261,11 @@ class Config:
         """Get overwrite setting."""
         return self.get('output.overwrite', False)
 
+    @property
+    def output_fsync(self) -> bool:
+        """Get whether written files are flushed to disk."""
+        return self.get('output.fsync', False)
+
     @property
     def log_level(self) -> str:
         """Get log level."""
@@ -232,6 +296,16 @@ class Config:
         """Get images directory."""
         return self.get('images.directory', './output/images')
 
+    @property
+    def cache_directory(self) -> str:
+        """Get cache directory."""
+        return self.get('cache.directory', '~/.cache/jira_to_markdown')
+
+    @property
+    def cache_fields_ttl(self) -> int:
+        """Get custom field cache lifetime in seconds."""
+        return self.get('cache.fields_ttl', 3600)
+
     def to_dict(self) -> Dict[str, Any]:
         """Return configuration as dictionary."""
         return self._config.copy()
@@ -4,9 +4,14 @@ File output management with safety checks.
 
 import os
 import re
+import json
+import hashlib
 import logging
-from typing import Dict
 import tempfile
+import threading
+from typing import Dict, Tuple, Union
+
+logger = logging.getLogger(__name__)
 
 
 class FileWriteError(Exception):
@@ -14,10 +19,48 @@ class FileWriteError(Exception):
     pass
 
 
+def create_temp_file(directory: str, prefix: str) -> Tuple[int, str]:
+    """
+    Create a new, uniquely named temporary file for writing.
+
+    Unlike tempfile.mkstemp, which makes the file readable by its owner
+    only, the file gets the permissions a plain open() would give it under
+    the current umask, so it can be renamed over its target as is.
+
+    Args:
+        directory: Directory to create the file in
+        prefix: Start of the file name
+
+    Returns:
+        Tuple of the open file descriptor and the file's path
+
+    Raises:
+        FileExistsError: If no unused name could be found
+    """
+    for _ in range(tempfile.TMP_MAX):
+        path = os.path.join(directory, f'{prefix}{os.urandom(6).hex()}.tmp')
+        try:
+            # O_EXCL: never reuse a file a concurrent writer or a killed run left behind
+            return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temporary file name in {directory}")
+
+
 class FileWriter:
     """Handles writing markdown files to disk."""
 
-    def __init__(self, output_dir: str, overwrite: bool = False, filename_format: str = "{key}.md"):
+    # Illegal on most filesystems: < > : " / \ | ? *
+    ILLEGAL_CHARS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+    # Sidecar file mapping each written filename to its content hash
+    INDEX_FILENAME = '.jira-to-md-index.json'
+    # The converter's "Generated on ..." footer changes on every run, so it
+    # is left out of the content hash
+    GENERATED_FOOTER_PATTERN = re.compile(rb'\*Generated on [^\n]*\*\s*\Z')
+
+    def __init__(self, output_dir: str, overwrite: bool = False, filename_format: str = "{key}.md",
+                 fsync: bool = False):
         """
         Initialize file writer.
 
@@ -25,15 +68,34 @@ class FileWriter:
             output_dir: Directory where files will be written
             overwrite: Whether to overwrite existing files
             filename_format: Format string for filenames (e.g., "{key}.md")
+            fsync: Whether to flush each file to disk before it replaces the
+                target, so a crash can't leave a truncated file behind
         """
         self.output_dir = output_dir
         self.overwrite = overwrite
         self.filename_format = filename_format
-        self.logger = logging.getLogger(__name__)
+        self.fsync = fsync
+        self.logger = logger
 
         # Ensure output directory exists
         self._ensure_directory(self.output_dir)
 
+        # Output directory with a trailing separator; filenames are already
+        # sanitized, so paths are built by concatenation
+        self._output_prefix = os.path.join(self.output_dir, '')
+
+        # Names already in the output directory, listed once so that
+        # existence checks don't stat the filesystem for every ticket.
+        # Guarded by a lock since the CLI writes from several threads.
+        self._existing = set()
+        self._lock = threading.Lock()
+        self.refresh_existing()
+
+        # filename -> [content hash, mtime_ns, size] of files this tool wrote;
+        # lets --overwrite skip rewriting tickets whose content is unchanged
+        self._index: Dict[str, list] = self._load_index()
+        self._index_dirty = False
+
     def write_ticket(self, ticket_key: str, markdown_content: str, ticket_data: Dict = None) -> str:
         """
         Write a single ticket to a markdown file.
@@ -51,21 +113,41 @@ class FileWriter:
         """
         # Generate filename
         filename = self._generate_filename(ticket_key, ticket_data)
-        filepath = os.path.join(self.output_dir, filename)
-
-        # Check if file exists and overwrite is disabled
-        if not self.overwrite and os.path.exists(filepath):
-            self.logger.warning(f"File {filepath} already exists, skipping (use --overwrite to replace)")
-            return filepath
+        filepath = self._output_prefix + filename
+
+        data = markdown_content.encode('utf-8')
+        digest = hashlib.blake2b(
+            self.GENERATED_FOOTER_PATTERN.sub(b'', data), digest_size=16
+        ).hexdigest()
+
+        # Check if file exists and overwrite is disabled; the name is claimed
+        # in the same step so two tickets mapping to one file can't both write
+        with self._lock:
+            existed = filename in self._existing
+            if existed and not self.overwrite:
+                self.logger.warning(f"File {filepath} already exists, skipping (use --overwrite to replace)")
+                return filepath
+            if existed and self._is_unchanged(filepath, filename, digest):
+                self.logger.info(f"Unchanged {filepath}, skipping")
+                return filepath
+            self._existing.add(filename)
 
         # Write file atomically
         try:
-            self._write_atomic(filepath, markdown_content)
-            self.logger.info(f"Written {filepath}")
-            return filepath
+            stat = self._write_atomic(filepath, data)
         except Exception as e:
+            if not existed:
+                with self._lock:
+                    self._existing.discard(filename)
             raise FileWriteError(f"Failed to write {filepath}: {e}")
 
+        with self._lock:
+            self._index[filename] = [digest, stat.st_mtime_ns, stat.st_size]
+            self._index_dirty = True
+
+        self.logger.info(f"Written {filepath}")
+        return filepath
+
     def write_multiple(self, tickets_data: Dict[str, tuple]) -> list:
         """
         Write multiple tickets to markdown files.
@@ -132,8 +214,7 @@ class FileWriter:
             Sanitized filename
         """
         # Remove or replace illegal characters for most filesystems
-        # Illegal: < > : " / \ | ? *
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        filename = filename.translate(self.ILLEGAL_CHARS_TABLE)
 
         # Remove leading/trailing spaces and dots
         filename = filename.strip('. ')
@@ -168,7 +249,7 @@ class FileWriter:
         except Exception as e:
             raise FileWriteError(f"Failed to create directory {path}: {e}")
 
-    def _write_atomic(self, filepath: str, content: str):
+    def _write_atomic(self, filepath: str, content: Union[str, bytes]) -> os.stat_result:
         """
         Write file atomically using a temporary file.
 
@@ -177,7 +258,10 @@ class FileWriter:
 
         Args:
             filepath: Target file path
-            content: Content to write
+            content: Content to write, as text or already UTF-8 encoded
+
+        Returns:
+            Stat of the written file
 
         Raises:
             Exception: If writing fails
@@ -186,29 +270,76 @@ class FileWriter:
         directory = os.path.dirname(filepath)
         filename = os.path.basename(filepath)
 
-        # Write to temporary file in the same directory
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding='utf-8',
-            dir=directory,
-            prefix=f'.{filename}.',
-            suffix='.tmp',
-            delete=False
-        ) as temp_file:
-            temp_path = temp_file.name
-            temp_file.write(content)
+        # Encode once and hand the bytes straight to the OS, bypassing the
+        # buffered text layer
+        data = content.encode('utf-8') if isinstance(content, str) else content
+
+        # Write to a fresh temporary file in the same directory
+        temp_fd, temp_path = create_temp_file(directory, f'.{filename}.')
 
         try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(temp_fd, view):]
+                if self.fsync:
+                    os.fsync(temp_fd)
+                stat = os.fstat(temp_fd)
+            finally:
+                os.close(temp_fd)
+
             # Atomic rename (or as atomic as possible on the platform)
             os.replace(temp_path, filepath)
+            return stat
         except Exception as e:
-            # Clean up temp file if rename fails
+            # Clean up temp file if write or rename fails
             try:
                 os.remove(temp_path)
-            except:
+            except OSError:
                 pass
             raise e
 
+    def close(self):
+        """Save the content hash index if anything was written."""
+        with self._lock:
+            if not self._index_dirty:
+                return
+            data = json.dumps(self._index, separators=(',', ':'))
+            self._index_dirty = False
+
+        try:
+            self._write_atomic(self._output_prefix + self.INDEX_FILENAME, data)
+        except OSError as e:
+            self.logger.warning(f"Could not save content index: {e}")
+
+    def _load_index(self) -> Dict[str, list]:
+        """Load the content hash index, or start a fresh one."""
+        if self.INDEX_FILENAME not in self._existing:
+            return {}
+        try:
+            with open(self._output_prefix + self.INDEX_FILENAME, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable content index: {e}")
+            return {}
+
+    def _is_unchanged(self, filepath: str, filename: str, digest: str) -> bool:
+        """
+        Check whether a file still holds exactly what was last written to it.
+
+        The hash only counts if the file's mtime and size are still those
+        recorded at write time, so files edited since are rewritten.
+        """
+        entry = self._index.get(filename)
+        if not entry or entry[0] != digest:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return [stat.st_mtime_ns, stat.st_size] == entry[1:]
+
     def get_existing_files(self) -> list:
         """
         Get list of existing markdown files in output directory.
@@ -237,5 +368,23 @@ class FileWriter:
             True if file exists
         """
         filename = self._generate_filename(ticket_key)
-        filepath = os.path.join(self.output_dir, filename)
-        return os.path.exists(filepath)
+        with self._lock:
+            return filename in self._existing
+
+    def refresh_existing(self):
+        """
+        Re-list the output directory.
+
+        Existence checks use the listing taken when the writer was created
+        plus the files it wrote since; call this if other processes may have
+        added files in the meantime.
+        """
+        try:
+            with os.scandir(self.output_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError as e:
+            self.logger.warning(f"Could not list {self.output_dir}: {e}")
+            existing = set()
+
+        with self._lock:
+            self._existing = existing
@@ -2,16 +2,33 @@
 Image downloader for JIRA attachments and external URLs.
 """
 
+import io
 import os
 import re
+import json
+import mmap
 import logging
-import tempfile
 import hashlib
+import threading
+from functools import lru_cache
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, NamedTuple
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, NamedTuple, Set, Tuple
+from urllib.parse import ParseResult, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .file_writer import create_temp_file
+
+_HTTP_SCHEMES = ('http://', 'https://')
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse(url: str) -> ParseResult:
+    """urlparse, memoized since one image URL is often referenced many times."""
+    return urlparse(url)
 
 
 class ImageInfo(NamedTuple):
@@ -20,6 +37,7 @@ class ImageInfo(NamedTuple):
     url: str
     full_match: str
     is_jira: bool
+    is_remote: bool
 
 
 class DownloadResult(NamedTuple):
@@ -27,14 +45,34 @@ class DownloadResult(NamedTuple):
     success: bool
     local_path: Optional[str]
     error: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
 
 
 class ImageDownloader:
     """Downloads images from markdown files and updates paths."""
 
     IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+    TICKET_KEY_PATTERN = re.compile(r'^([A-Z]+-\d+)')
+    # Illegal on most filesystems: < > : " / \ | ? *
+    ILLEGAL_CHARS_PATTERN = re.compile(r'[<>:"/\\|?*]')
     IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.bmp', '.ico'}
     MAX_IMAGE_SIZE = 50 * 1024 * 1024  # 50MB
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024  # 256KB
+    # Most downloads allowed in flight against JIRA at once, whatever the
+    # number of workers; external hosts are only bounded by the workers
+    JIRA_CONCURRENCY = 8
+    USER_AGENT = 'jira-to-markdown/1.0'
+    # Files larger than this are memory-mapped and searched for a remote
+    # image before being read and decoded
+    MMAP_THRESHOLD = 1024 * 1024  # 1MB
+    # Every remote image reference contains this: the end of the alt text
+    # followed by an http(s) URL
+    REMOTE_IMAGE_MARKER = b'](http'
+    # Kept in the images directory: what each URL was saved as, with the
+    # validators the server sent for it
+    CACHE_FILENAME = '.download_cache.json'
 
     def __init__(
         self,
@@ -43,7 +81,8 @@ class ImageDownloader:
         jira_url: str,
         jira_username: str = None,
         jira_api_token: str = None,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        jira_session: Optional[requests.Session] = None
     ):
         """
         Initialize image downloader.
@@ -55,6 +94,9 @@ class ImageDownloader:
             jira_username: JIRA username for authentication
             jira_api_token: JIRA API token for authentication
             verify_ssl: Whether to verify SSL certificates
+            jira_session: Authenticated session of an existing JIRA connection;
+                reused for JIRA attachment downloads only, since it carries
+                the JIRA credentials on every request
         """
         self.output_dir = Path(output_dir)
         self.images_dir = Path(images_dir)
@@ -63,42 +105,181 @@ class ImageDownloader:
         self.jira_username = jira_username
         self.jira_api_token = jira_api_token
         self.verify_ssl = verify_ssl
+        self.jira_session = jira_session
         self.logger = logging.getLogger(__name__)
+
+        # Shared by every download not going through jira_session, so
+        # repeated requests to one host reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = self.USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'GET'}),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self._downloaded_files: Dict[str, str] = {}
+        self._jira_slots = threading.BoundedSemaphore(self.JIRA_CONCURRENCY)
+        # Every image name taken: the images directory as listed once by
+        # _image_names, plus names handed out since (their downloads
+        # may still be in flight, so they aren't on disk yet)
+        self._used_names: Optional[Set[str]] = None
+
+        # url -> {'file', 'etag', 'last_modified'} of images downloaded by
+        # earlier runs, so they aren't fetched (or named) again
+        self._cache: Dict[str, Dict[str, Optional[str]]] = self._load_cache()
+        self._cache_dirty = False
+
+    def close(self):
+        """Save the download cache and release the pooled connections."""
+        try:
+            self._save_cache()
+        finally:
+            self.session.close()
+
+    def __enter__(self):
+        return self
 
-    def process_directory(self) -> Dict[str, Dict]:
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def process_directory(self, max_workers: int = 1) -> Dict[str, Dict]:
         """
         Process all markdown files in the output directory.
 
+        Every file is scanned before anything is downloaded, so each distinct
+        image URL is fetched once and downloads for different files run side
+        by side; files are rewritten once all downloads have finished. Files
+        are also read and rewritten in parallel on the same workers.
+
+        Args:
+            max_workers: Maximum number of concurrent image downloads
+
         Returns:
             Dictionary mapping filenames to processing results
         """
-        self._ensure_directory(self.images_dir)
+        self._image_names()  # Creates and lists the images directory
 
-        results = {}
-        md_files = list(self.output_dir.glob('*.md'))
+        md_files = self.find_markdown_files()
 
-        self.logger.info(f"Found {len(md_files)} markdown files to process")
+        self.logger.info("Found %d markdown files to process", len(md_files))
 
-        for md_file in md_files:
-            result = self.process_file(md_file)
-            results[md_file.name] = result
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        run = executor.map if executor else map
+
+        try:
+            results = {}
+            scanned = []
+            pending: Dict[str, Tuple[ImageInfo, Path]] = {}
+
+            # Planning stays on this thread, in file order, so image names
+            # come out the same however the scans were scheduled
+            for md_file, (result, content, images) in zip(md_files, run(self._scan_file, md_files)):
+                results[md_file.name] = result
+                if content is not None:
+                    scanned.append((md_file, content, images, result))
+                    self._plan_downloads(result['ticket_key'], images, pending)
+
+            failures = self._download_all(pending, executor)
+
+            # Each rewrite only touches its own file and result; the shared
+            # download map is read-only by now
+            list(run(lambda item: self._rewrite_file(*item, failures), scanned))
+        finally:
+            if executor:
+                executor.shutdown()
 
         return results
 
-    def process_file(self, filepath: Path) -> Dict:
+    def process_file(self, filepath: Path, max_workers: int = 1) -> Dict:
         """
         Process a single markdown file.
 
         Args:
             filepath: Path to the markdown file
+            max_workers: Maximum number of concurrent image downloads
 
         Returns:
             Dictionary with processing results
         """
+        result, content, images = self._scan_file(filepath)
+
+        if content is not None:
+            pending: Dict[str, Tuple[ImageInfo, Path]] = {}
+            self._plan_downloads(result['ticket_key'], images, pending)
+            if max_workers > 1 and len(pending) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                    failures = self._download_all(pending, executor)
+            else:
+                failures = self._download_all(pending)
+            self._rewrite_file(filepath, content, images, result, failures)
+
+        return result
+
+    def find_markdown_files(self) -> List[Path]:
+        """
+        List the markdown files directly inside the output directory.
+
+        Returns:
+            Paths of the markdown files, in directory order; empty if the
+            output directory doesn't exist
+        """
+        # scandir reports the entry type from the directory listing itself,
+        # so unlike Path.glob no file needs a separate stat
+        try:
+            with os.scandir(self.output_dir) as entries:
+                return [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith('.md') and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+    def collect_remote_images(self, md_files: List[Path],
+                              max_workers: int = 1) -> Dict[str, List[Tuple[Path, ImageInfo]]]:
+        """
+        Find the remote images referenced by markdown files, without downloading.
+
+        Args:
+            md_files: Markdown files to scan
+            max_workers: Number of files read concurrently
+
+        Returns:
+            Dictionary mapping each distinct remote URL to every (file, image)
+            referencing it, in file order
+        """
+        if max_workers > 1 and len(md_files) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                scans = list(executor.map(self._scan_file, md_files))
+        else:
+            scans = [self._scan_file(md_file) for md_file in md_files]
+
+        url_map: Dict[str, List[Tuple[Path, ImageInfo]]] = {}
+        for md_file, (_, _, images) in zip(md_files, scans):
+            for img in images:
+                if img.is_remote:
+                    url_map.setdefault(img.url, []).append((md_file, img))
+
+        return url_map
+
+    def _scan_file(self, filepath: Path) -> Tuple[Dict, Optional[str], List[ImageInfo]]:
+        """
+        Read a markdown file and find its images.
+
+        Returns:
+            The file's result dictionary, plus its content and images; content
+            is None when the file can't be read or has no remote images
+        """
         ticket_key = self._extract_ticket_key(filepath)
 
-        self.logger.debug(f"Processing {filepath.name} (ticket: {ticket_key})")
+        self.logger.debug("Processing %s (ticket: %s)", filepath.name, ticket_key)
 
         result = {
             'ticket_key': ticket_key,
@@ -110,65 +291,151 @@ class ImageDownloader:
         }
 
         try:
-            content = filepath.read_text(encoding='utf-8')
+            content = self._read_markdown(filepath)
         except Exception as e:
             result['errors'].append(f"Failed to read file: {e}")
-            return result
+            return result, None, []
 
-        images = self._find_images(content)
-        result['images_found'] = len([img for img in images if self._is_remote_url(img.url)])
+        images = self._find_images(content) if content is not None else []
+        result['images_found'] = sum(1 for img in images if img.is_remote)
 
         if result['images_found'] == 0:
-            self.logger.debug(f"No remote images found in {filepath.name}")
-            return result
+            self.logger.debug("No remote images found in %s", filepath.name)
+            return result, None, []
+
+        result['images_skipped'] = len(images) - result['images_found']
+        return result, content, images
+
+    def _read_markdown(self, filepath: Path) -> Optional[str]:
+        """
+        Read a markdown file's text.
+
+        Large files are first searched through a memory map, so one without
+        remote images is never read into memory or decoded.
 
-        updated_content = content
+        Returns:
+            The file's content, or None if it has no remote images
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if mapped.find(self.REMOTE_IMAGE_MARKER) == -1:
+                        return None
+
+            # Same newline handling as Path.read_text
+            with io.TextIOWrapper(f, encoding='utf-8') as text:
+                return text.read()
+
+    def _plan_downloads(self, ticket_key: str, images: List[ImageInfo],
+                        pending: Dict[str, Tuple[ImageInfo, Path]]):
+        """
+        Add a file's not yet downloaded URLs to the pending downloads.
+
+        Local names are picked here, in file order, so downloads can then run
+        in any order without two of them racing for the same filename. The
+        first file referencing a URL names its image.
+        """
         for img in images:
-            if not self._is_remote_url(img.url):
-                result['images_skipped'] += 1
+            if (not img.is_remote or img.url in self._downloaded_files
+                    or img.url in pending):
                 continue
 
-            local_filename = self._generate_filename(ticket_key, img.url, img.alt_text)
-            local_path = self.images_dir / local_filename
-
-            if img.url in self._downloaded_files:
-                existing_path = self._downloaded_files[img.url]
-                relative_path = self._get_relative_path(filepath.parent, Path(existing_path))
-                updated_content = self._replace_image_reference(updated_content, img, relative_path)
-                result['images_downloaded'] += 1
+            cached = self._cache.get(img.url)
+            if cached and cached['file'] in self._image_names():
+                local_path = self.images_dir / cached['file']
+                if img.is_jira:
+                    # JIRA attachments never change once uploaded
+                    self._downloaded_files[img.url] = str(local_path)
+                else:
+                    # Revalidated into the same file; usually just a 304
+                    pending[img.url] = (img, local_path)
                 continue
 
-            download_result = self._download_image(img.url, local_path, img.is_jira)
+            local_filename = self._generate_filename(ticket_key, img.url, img.alt_text)
+            pending[img.url] = (img, self.images_dir / local_filename)
+
+    def _download_all(self, pending: Dict[str, Tuple[ImageInfo, Path]],
+                      executor: Optional[Executor] = None) -> Dict[str, str]:
+        """
+        Download every pending image, concurrently if given an executor.
 
+        Returns:
+            Dictionary mapping each URL that failed to its error message
+        """
+        def download(item: Tuple[ImageInfo, Path]) -> DownloadResult:
+            img, local_path = item
+            if img.is_jira:
+                # Keeps a wide worker pool from tripping JIRA's rate limits
+                with self._jira_slots:
+                    return self._download_image(img.url, local_path, True)
+            return self._download_image(img.url, local_path, False)
+
+        items = list(pending.values())
+        if executor is not None and len(items) > 1:
+            outcomes = list(executor.map(download, items))
+        else:
+            outcomes = [download(item) for item in items]
+
+        failures = {}
+        for (img, local_path), download_result in zip(items, outcomes):
             if download_result.success:
-                self._downloaded_files[img.url] = str(local_path)
-                relative_path = self._get_relative_path(filepath.parent, local_path)
-                updated_content = self._replace_image_reference(updated_content, img, relative_path)
-                result['images_downloaded'] += 1
-                self.logger.info(f"Downloaded: {local_filename}")
+                self._downloaded_files[img.url] = download_result.local_path
+                if download_result.not_modified:
+                    self.logger.info("Unchanged: %s", local_path.name)
+                    continue
+                self._cache[img.url] = {
+                    'file': local_path.name,
+                    'etag': download_result.etag,
+                    'last_modified': download_result.last_modified
+                }
+                self._cache_dirty = True
+                self.logger.info("Downloaded: %s", local_path.name)
             else:
+                failures[img.url] = download_result.error
+                self.logger.warning("Failed to download %s: %s", img.url, download_result.error)
+
+        return failures
+
+    def _rewrite_file(self, filepath: Path, content: str, images: List[ImageInfo],
+                      result: Dict, failures: Dict[str, str]):
+        """Point a file's downloaded images at their local copies and tally the result."""
+        # New markdown for each image reference, applied in a single pass
+        replacements: Dict[str, str] = {}
+        for img in images:
+            if not img.is_remote:
+                continue
+
+            if img.url in failures:
                 result['images_failed'] += 1
-                result['errors'].append(f"{img.url}: {download_result.error}")
-                self.logger.warning(f"Failed to download {img.url}: {download_result.error}")
+                result['errors'].append(f"{img.url}: {failures[img.url]}")
+                continue
 
-        if updated_content != content:
-            self._write_atomic(filepath, updated_content)
-            self.logger.info(f"Updated {filepath.name}")
+            if img.full_match not in replacements:
+                local_path = Path(self._downloaded_files[img.url])
+                relative_path = self._get_relative_path(filepath.parent, local_path)
+                replacements[img.full_match] = f'![{img.alt_text}]({relative_path})'
+            result['images_downloaded'] += 1
 
-        return result
+        if not replacements:
+            return
 
-    def _replace_image_reference(self, content: str, img: ImageInfo, new_path: str) -> str:
-        """Replace an image reference in content with a new path."""
-        return content.replace(
-            img.full_match,
-            f'![{img.alt_text}]({new_path})',
-            1
+        updated_content = self.IMAGE_PATTERN.sub(
+            lambda match: replacements.get(match.group(0), match.group(0)),
+            content
         )
+        if updated_content != content:
+            self._write_atomic(filepath, updated_content)
+            self.logger.info("Updated %s", filepath.name)
 
     def _find_images(self, content: str) -> List[ImageInfo]:
         """Find all image references in markdown content."""
         images = []
 
+        # Cheap substring check first: most files have no image syntax at
+        # all and can skip the regex scan entirely
+        if '![' not in content:
+            return images
+
         for match in self.IMAGE_PATTERN.finditer(content):
             alt_text = match.group(1)
             url = match.group(2)
@@ -179,7 +446,8 @@ class ImageDownloader:
                 alt_text=alt_text,
                 url=url,
                 full_match=full_match,
-                is_jira=is_jira
+                is_jira=is_jira,
+                is_remote=url.startswith(_HTTP_SCHEMES)
             ))
 
         return images
@@ -188,7 +456,7 @@ class ImageDownloader:
         """Check if URL points to JIRA attachment."""
         if not self.jira_domain:
             return False
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         return (
             parsed.netloc == self.jira_domain or
             ('/rest/api/' in url and '/attachment/' in url)
@@ -196,7 +464,7 @@ class ImageDownloader:
 
     def _is_remote_url(self, url: str) -> bool:
         """Check if URL is a remote HTTP/HTTPS URL."""
-        return url.startswith(('http://', 'https://'))
+        return url.startswith(_HTTP_SCHEMES)
 
     def _extract_ticket_key(self, filepath: Path) -> str:
         """
@@ -207,7 +475,7 @@ class ImageDownloader:
         - PROJ-123 Some Title.md
         """
         filename = filepath.stem
-        match = re.match(r'^([A-Z]+-\d+)', filename)
+        match = self.TICKET_KEY_PATTERN.match(filename)
         if match:
             return match.group(1)
         return filename
@@ -218,7 +486,7 @@ class ImageDownloader:
 
         Format: {ticket-key}-{original-filename}
         """
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         path = parsed.path
         original_name = Path(path).name if path else ''
 
@@ -226,18 +494,22 @@ class ImageDownloader:
             if alt_text and self._has_image_extension(alt_text):
                 original_name = alt_text
             else:
-                url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+                # Only a short identifier, so no cryptographic hash is needed
+                url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
                 original_name = f"image-{url_hash}.png"
 
         original_name = self._sanitize_filename(original_name)
         final_name = f"{ticket_key}-{original_name}"
 
+        used_names = self._image_names()
+
         base_name, ext = os.path.splitext(final_name)
         counter = 1
-        while (self.images_dir / final_name).exists():
+        while final_name in used_names:
             final_name = f"{base_name}-{counter}{ext}"
             counter += 1
 
+        used_names.add(final_name)
         return final_name
 
     def _has_image_extension(self, filename: str) -> bool:
@@ -245,9 +517,11 @@ class ImageDownloader:
         ext = Path(filename).suffix.lower()
         return ext in self.IMAGE_EXTENSIONS
 
-    def _sanitize_filename(self, filename: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _sanitize_filename(filename: str) -> str:
         """Sanitize filename for filesystem compatibility."""
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        filename = ImageDownloader.ILLEGAL_CHARS_PATTERN.sub('_', filename)
         filename = filename.strip('. ')
 
         if len(filename) > 200:
@@ -263,19 +537,35 @@ class ImageDownloader:
         Args:
             url: Image URL
             local_path: Where to save the image
-            is_jira: Whether this is a JIRA URL (requires auth)
+            is_jira: Whether this is a JIRA URL (authenticated if on the JIRA host)
 
         Returns:
             DownloadResult with success status
         """
         try:
-            headers = {'User-Agent': 'jira-to-markdown/1.0'}
+            headers = {'User-Agent': self.USER_AGENT}
             auth = None
 
-            if is_jira and self.jira_username and self.jira_api_token:
-                auth = (self.jira_username, self.jira_api_token)
-
-            response = requests.get(
+            # Only revalidate when downloading over the file the cache
+            # entry describes
+            cached = self._cache.get(url)
+            if cached and cached['file'] == local_path.name:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+
+            http = self.session
+            # Credentials only ever go to the configured JIRA host, never to
+            # another host serving a JIRA-like attachment path
+            if is_jira and _cached_urlparse(url).netloc == self.jira_domain:
+                if self.jira_session is not None:
+                    # Already authenticated; reuses the open connections to JIRA
+                    http = self.jira_session
+                elif self.jira_username and self.jira_api_token:
+                    auth = (self.jira_username, self.jira_api_token)
+
+            response = http.get(
                 url,
                 auth=auth,
                 headers=headers,
@@ -283,13 +573,15 @@ class ImageDownloader:
                 timeout=30,
                 verify=self.verify_ssl
             )
+            if response.status_code == 304:
+                response.close()
+                return DownloadResult(success=True, local_path=str(local_path), error=None,
+                                      not_modified=True)
             response.raise_for_status()
 
-            self._ensure_directory(local_path.parent)
-
             def write_chunks(f):
                 downloaded_size = 0
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
                     downloaded_size += len(chunk)
                     if downloaded_size > self.MAX_IMAGE_SIZE:
                         raise Exception(f"Image exceeds maximum size of {self.MAX_IMAGE_SIZE} bytes")
@@ -297,7 +589,13 @@ class ImageDownloader:
 
             self._atomic_write(local_path, write_chunks, mode='wb')
 
-            return DownloadResult(success=True, local_path=str(local_path), error=None)
+            return DownloadResult(
+                success=True,
+                local_path=str(local_path),
+                error=None,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
 
         except requests.exceptions.HTTPError as e:
             return DownloadResult(success=False, local_path=None, error=f"HTTP {e.response.status_code}")
@@ -308,6 +606,35 @@ class ImageDownloader:
         except Exception as e:
             return DownloadResult(success=False, local_path=None, error=str(e))
 
+    def _load_cache(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Load the download cache, or start a fresh one."""
+        try:
+            with open(self.images_dir / self.CACHE_FILENAME, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable download cache: %s", e)
+            return {}
+
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            url: entry for url, entry in cache.items()
+            if isinstance(entry, dict) and isinstance(entry.get('file'), str)
+        }
+
+    def _save_cache(self):
+        """Save the download cache if anything was downloaded."""
+        if not self._cache_dirty:
+            return
+        try:
+            self._write_atomic(self.images_dir / self.CACHE_FILENAME,
+                               json.dumps(self._cache, separators=(',', ':')))
+            self._cache_dirty = False
+        except OSError as e:
+            self.logger.warning("Could not save download cache: %s", e)
+
     def _get_relative_path(self, from_dir: Path, to_file: Path) -> str:
         """Calculate relative path from markdown file to image."""
         try:
@@ -315,6 +642,19 @@ class ImageDownloader:
         except ValueError:
             return str(to_file)
 
+    def _image_names(self) -> Set[str]:
+        """
+        Get the names taken in the images directory.
+
+        The directory is created and listed once, on first use, so neither
+        naming nor downloading an image has to touch it again; a dry run
+        never creates it.
+        """
+        if self._used_names is None:
+            self._ensure_directory(self.images_dir)
+            self._used_names = set(os.listdir(self.images_dir))
+        return self._used_names
+
     def _ensure_directory(self, path: Path):
         """Create directory if it doesn't exist."""
         path.mkdir(parents=True, exist_ok=True)
@@ -329,11 +669,7 @@ class ImageDownloader:
             mode: File mode ('w' for text, 'wb' for binary)
             encoding: Encoding for text mode (ignored for binary)
         """
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=filepath.parent,
-            prefix=f'.{filepath.name}.',
-            suffix='.tmp'
-        )
+        temp_fd, temp_path = create_temp_file(str(filepath.parent), f'.{filepath.name}.')
 
         try:
             open_kwargs = {'mode': mode}
@@ -351,4 +687,7 @@ class ImageDownloader:
 
     def _write_atomic(self, filepath: Path, content: str):
         """Write text content to file atomically."""
-        self._atomic_write(filepath, lambda f: f.write(content), mode='w', encoding='utf-8')
+        # Encoded in one go and written in binary mode, matching FileWriter,
+        # so the text layer neither re-encodes per buffer nor translates newlines
+        data = content.encode('utf-8')
+        self._atomic_write(filepath, lambda f: f.write(data), mode='wb')
@@ -4,8 +4,16 @@ JIRA API client wrapper with authentication and error handling.
 
 from jira import JIRA
 from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import json
 import logging
-from typing import List, Optional, Dict
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Dict
 
 
 class JiraConnectionError(Exception):
@@ -26,7 +34,26 @@ class TicketNotFoundError(Exception):
 class JiraClient:
     """Wrapper around JIRA Python library with enhanced error handling."""
 
-    def __init__(self, url: str, username: str, api_token: str, verify_ssl: bool = True):
+    POOL_CONNECTIONS = 16
+
+    # Transport-level retries for failures jira's ResilientSession doesn't
+    # handle itself (it already backs off on 429/503 and connection errors,
+    # but only after a long delay). Idempotent requests only; the final
+    # response is handed back rather than raised so JIRAError still applies.
+    TRANSPORT_RETRY = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=2,
+        status_forcelist=(502, 504),
+        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+        backoff_factor=0.5,
+        raise_on_status=False
+    )
+
+    def __init__(self, url: str, username: str, api_token: str, verify_ssl: bool = True,
+                 pool_maxsize: int = 32, cache_dir: Optional[str] = None,
+                 fields_cache_ttl: int = 3600):
         """
         Initialize JIRA client.
 
@@ -35,11 +62,17 @@ class JiraClient:
             username: JIRA username (email)
             api_token: JIRA API token
             verify_ssl: Whether to verify SSL certificates
+            pool_maxsize: Maximum number of keep-alive connections per host
+            cache_dir: Directory for the on-disk custom field cache (None disables it)
+            fields_cache_ttl: Seconds a cached custom field mapping stays valid
         """
         self.url = url
         self.username = username
         self.api_token = api_token
         self.verify_ssl = verify_ssl
+        self.pool_maxsize = pool_maxsize
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.fields_cache_ttl = fields_cache_ttl
         self.logger = logging.getLogger(__name__)
         self._jira = None
         self._custom_fields = None
@@ -56,7 +89,7 @@ class JiraClient:
             JiraAuthenticationError: If authentication fails
         """
         try:
-            self.logger.info(f"Connecting to JIRA at {self.url}")
+            self.logger.info("Connecting to JIRA at %s", self.url)
 
             # Create JIRA client with basic auth
             options = {
@@ -68,10 +101,11 @@ class JiraClient:
                 options=options,
                 basic_auth=(self.username, self.api_token)
             )
+            self._mount_pooled_adapter()
 
             # Test connection by getting server info
             server_info = self._jira.server_info()
-            self.logger.info(f"Connected to JIRA version {server_info.get('version', 'unknown')}")
+            self.logger.info("Connected to JIRA version %s", server_info.get('version', 'unknown'))
 
             return True
 
@@ -85,6 +119,28 @@ class JiraClient:
         except Exception as e:
             raise JiraConnectionError(f"Failed to connect to JIRA: {str(e)}")
 
+    @property
+    def session(self):
+        """Underlying requests session, or None if not connected."""
+        return self._jira._session if self._jira else None
+
+    def _mount_pooled_adapter(self):
+        """
+        Size the session's connection pool for concurrent requests.
+
+        Keep-alive connections are reused across tickets, so the TCP and
+        TLS handshakes are paid once per connection rather than per request.
+        Refused connections and gateway errors are retried quickly here
+        before they reach the slower ResilientSession backoff.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.TRANSPORT_RETRY
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def test_connection(self) -> bool:
         """
         Test JIRA connection and credentials.
@@ -125,7 +181,7 @@ class JiraClient:
             self.connect()
 
         try:
-            self.logger.debug(f"Fetching issue {key}")
+            self.logger.debug("Fetching issue %s", key)
             issue = self._jira.issue(key, fields=fields)
             return issue
         except JIRAError as e:
@@ -155,7 +211,7 @@ class JiraClient:
             self.connect()
 
         try:
-            self.logger.debug(f"Searching issues with JQL: {jql}")
+            self.logger.debug("Searching issues with JQL: %s", jql)
             # Use enhanced_search_issues for Jira Cloud (search_issues is deprecated)
             if hasattr(self._jira, 'enhanced_search_issues'):
                 issues = self._jira.enhanced_search_issues(
@@ -171,20 +227,26 @@ class JiraClient:
                     startAt=start_at,
                     fields=fields
                 )
-            self.logger.info(f"Found {len(issues)} issues")
+            self.logger.info("Found %d issues", len(issues))
             return issues
         except JIRAError as e:
             raise JiraConnectionError(f"Failed to search issues: {e.text}")
 
     def search_all_issues(self, jql: str, fields: str = '*all',
-                         batch_size: int = 50) -> List[object]:
+                         batch_size: int = 50, max_workers: int = 8) -> List[object]:
         """
         Search for all issues matching JQL with automatic pagination.
 
+        On Jira Server the first page reports how many issues match, so the
+        remaining pages are then requested concurrently rather than one after
+        another. Jira Cloud pages by nextPageToken, where each page names the
+        next, so there the pages are followed in turn.
+
         Args:
             jql: JQL query string
             fields: Fields to include
-            batch_size: Number of results per request (used internally by JIRA library)
+            batch_size: Number of results per request
+            max_workers: Maximum number of pages requested at once
 
         Returns:
             List of all matching JIRA issue objects
@@ -195,22 +257,140 @@ class JiraClient:
         if not self._jira:
             self.connect()
 
+        if self._uses_token_paging():
+            all_issues = [
+                issue
+                for page in self.iter_search_pages(jql, fields=fields, page_size=batch_size)
+                for issue in page
+            ]
+            self.logger.info("Retrieved %d issues total", len(all_issues))
+            return all_issues
+
         try:
-            self.logger.debug(f"Searching all issues with JQL: {jql}")
+            self.logger.debug("Searching all issues with JQL: %s", jql)
 
-            # Use maxResults=False to fetch all issues automatically
-            # This works for both JIRA Cloud and Server and avoids deprecation warnings
-            all_issues = self._jira.search_issues(
+            first_page = self._jira.search_issues(
                 jql,
-                maxResults=False,  # Library handles pagination automatically
+                startAt=0,
+                maxResults=batch_size,
                 fields=fields
             )
-
-            self.logger.info(f"Retrieved {len(all_issues)} issues total")
-            return list(all_issues)
+            all_issues = list(first_page)
+
+            # Step by what the server actually returned, since it may cap
+            # the page size below batch_size
+            page_size = len(first_page)
+            offsets = range(page_size, first_page.total, page_size) if page_size else range(0)
+
+            if offsets:
+                def fetch_page(start_at: int) -> List[object]:
+                    return self._jira.search_issues(
+                        jql,
+                        startAt=start_at,
+                        maxResults=page_size,
+                        fields=fields
+                    )
+
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+                    # map keeps the pages in JIRA's order
+                    for page in executor.map(fetch_page, offsets):
+                        all_issues.extend(page)
+
+            self.logger.info("Retrieved %d issues total", len(all_issues))
+            return all_issues
         except JIRAError as e:
             raise JiraConnectionError(f"Failed to search issues: {e.text}")
 
+    def iter_search_pages(self, jql: str, fields: str = '*all', page_size: int = 50,
+                          max_results: Optional[int] = None) -> Iterator[List[object]]:
+        """
+        Search for issues using JQL, yielding one page at a time.
+
+        Unlike search_all_issues, the caller can start processing the first
+        page before the remaining pages have been requested. Jira Cloud is
+        paged by nextPageToken; offsets are only used on Jira Server.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to include
+            page_size: Number of issues requested per page
+            max_results: Maximum number of issues overall (None for all)
+
+        Yields:
+            Lists of JIRA issue objects; each page carries a ``total``
+            attribute with the number of matching issues (an estimate on
+            Jira Cloud, which doesn't report an exact count)
+
+        Raises:
+            JiraConnectionError: If search fails
+        """
+        if not self._jira:
+            self.connect()
+
+        self.logger.debug("Streaming issues with JQL: %s", jql)
+        token_paging = self._uses_token_paging()
+        fetched = 0
+        next_token = None
+        total = None
+
+        while True:
+            limit = page_size if max_results is None else min(page_size, max_results - fetched)
+            if limit <= 0:
+                return
+
+            try:
+                if token_paging:
+                    page = self._jira.enhanced_search_issues(
+                        jql,
+                        nextPageToken=next_token,
+                        maxResults=limit,
+                        fields=fields
+                    )
+                else:
+                    page = self._jira.search_issues(
+                        jql,
+                        startAt=fetched,
+                        maxResults=limit,
+                        fields=fields
+                    )
+            except JIRAError as e:
+                raise JiraConnectionError(f"Failed to search issues: {e.text}")
+
+            if not page:
+                return
+
+            if token_paging:
+                next_token = getattr(page, 'nextPageToken', None)
+                if total is None:
+                    total = self._approximate_total(jql) if next_token else len(page)
+                # The estimate may lag behind what has actually been returned
+                page.total = total = max(total, fetched + len(page))
+
+            self.logger.debug("Fetched issues %d-%d of %d", fetched, fetched + len(page), page.total)
+            yield page
+
+            fetched += len(page)
+            if token_paging:
+                if not next_token:
+                    return
+            elif fetched >= page.total:
+                return
+
+    def _uses_token_paging(self) -> bool:
+        """Whether searches are paged by nextPageToken (Jira Cloud) rather than by offset."""
+        # jira-python 3.10+ defines enhanced_search_issues everywhere, but it
+        # only works against Cloud
+        return (hasattr(self._jira, 'enhanced_search_issues') and
+                getattr(self._jira, '_is_cloud', True))
+
+    def _approximate_total(self, jql: str) -> int:
+        """Approximate number of issues matching JQL on Jira Cloud, or 0 if unknown."""
+        try:
+            return int(self._jira.approximate_issue_count(jql))
+        except (AttributeError, JIRAError, TypeError, ValueError) as e:
+            self.logger.debug("Could not count issues for JQL: %s", e)
+            return 0
+
     def get_custom_fields(self) -> Dict[str, str]:
         """
         Get mapping of custom field IDs to field names.
@@ -224,6 +404,11 @@ class JiraClient:
         if self._custom_fields is not None:
             return self._custom_fields
 
+        cached = self._load_cached_fields()
+        if cached is not None:
+            self._custom_fields = cached
+            return self._custom_fields
+
         if not self._jira:
             self.connect()
 
@@ -239,12 +424,66 @@ class JiraClient:
                     field_name = field['name']
                     self._custom_fields[field_id] = field_name
 
-            self.logger.info(f"Found {len(self._custom_fields)} custom fields")
+            self.logger.info("Found %d custom fields", len(self._custom_fields))
+            self._save_cached_fields(self._custom_fields)
             return self._custom_fields
 
         except JIRAError as e:
             raise JiraConnectionError(f"Failed to fetch custom fields: {e.text}")
 
+    def _fields_cache_path(self) -> Optional[str]:
+        """Get cache file path for this JIRA instance and user."""
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(f"{self.url}|{self.username}".encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"custom_fields-{digest}.json")
+
+    def _load_cached_fields(self) -> Optional[Dict[str, str]]:
+        """Load custom field mapping from disk if the cache is still fresh."""
+        path = self._fields_cache_path()
+        if not path:
+            return None
+
+        try:
+            if time.time() - os.path.getmtime(path) >= self.fields_cache_ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                fields = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(fields, dict):
+            return None
+
+        self.logger.debug("Loaded %d custom fields from cache %s", len(fields), path)
+        return fields
+
+    def _save_cached_fields(self, fields: Dict[str, str]):
+        """Write custom field mapping to disk atomically (best effort)."""
+        path = self._fields_cache_path()
+        if not path:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_dir,
+                prefix='.custom_fields.',
+                suffix='.tmp'
+            )
+            try:
+                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                    json.dump(fields, f)
+                os.replace(temp_path, path)
+            except Exception:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+        except Exception as e:
+            self.logger.warning("Failed to cache custom fields: %s", e)
+
     def get_comments(self, issue_key: str) -> List[object]:
         """
         Get all comments for an issue.
@@ -265,7 +504,7 @@ class JiraClient:
             comments = self._jira.comments(issue_key)
             return comments
         except JIRAError as e:
-            self.logger.warning(f"Failed to fetch comments for {issue_key}: {e.text}")
+            self.logger.warning("Failed to fetch comments for %s: %s", issue_key, e.text)
             return []
 
     def disconnect(self):
@@ -4,29 +4,33 @@ Logging configuration for JIRA to Markdown converter.
 
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from colorama import Fore, Style, init
-
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+import sys
+from logging.handlers import MemoryHandler, RotatingFileHandler
 
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colored output for console."""
 
-    COLORS = {
-        'DEBUG': Fore.CYAN,
-        'INFO': Fore.GREEN,
-        'WARNING': Fore.YELLOW,
-        'ERROR': Fore.RED,
-        'CRITICAL': Fore.RED + Style.BRIGHT,
-    }
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Imported here so runs without a color console never load colorama
+        from colorama import Fore, Style
+
+        self.colors = {
+            'DEBUG': Fore.CYAN,
+            'INFO': Fore.GREEN,
+            'WARNING': Fore.YELLOW,
+            'ERROR': Fore.RED,
+            'CRITICAL': Fore.RED + Style.BRIGHT,
+        }
+        self.reset = Style.RESET_ALL
 
     def format(self, record):
         # Add color to level name
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{Style.RESET_ALL}"
+        if levelname in self.colors:
+            record.levelname = f"{self.colors[levelname]}{levelname}{self.reset}"
 
         # Format the message
         result = super().format(record)
@@ -55,7 +59,10 @@ def setup_logger(name, log_file=None, file_level=logging.INFO,
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)  # Capture all levels, handlers will filter
 
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates; closing them drains
+    # any buffered file records first
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers = []
 
     # Create formatters
@@ -63,10 +70,6 @@ def setup_logger(name, log_file=None, file_level=logging.INFO,
         '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    console_formatter = ColoredFormatter(
-        '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        datefmt='%H:%M:%S'
-    )
 
     # File handler with rotation
     if log_file:
@@ -78,14 +81,38 @@ def setup_logger(name, log_file=None, file_level=logging.INFO,
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
+            backupCount=5,
+            delay=True  # Not opened until the first record is written
         )
         file_handler.setLevel(file_level)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        # Records are written in batches rather than one write per record;
+        # errors go out immediately, and logging's exit hook flushes the rest
+        buffered_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(file_level)
+        logger.addHandler(buffered_handler)
 
     # Console handler
     if console_enabled:
+        console_format = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+
+        # Colors only for a terminal, and only unless NO_COLOR is set;
+        # otherwise colorama's stream wrapping is skipped altogether
+        if sys.stderr.isatty() and not os.environ.get('NO_COLOR'):
+            from colorama import init
+
+            # Initialize colorama for cross-platform colored output; done
+            # before the handler picks up sys.stderr
+            init(autoreset=True)
+            console_formatter = ColoredFormatter(console_format, datefmt='%H:%M:%S')
+        else:
+            console_formatter = logging.Formatter(console_format, datefmt='%H:%M:%S')
+
         console_handler = logging.StreamHandler()
         console_handler.setLevel(console_level)
         console_handler.setFormatter(console_formatter)
@@ -4,13 +4,41 @@ Markdown conversion logic for JIRA tickets.
 
 import re
 import logging
-from typing import Dict, Any, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta
+
+
+@lru_cache(maxsize=4096)
+def _strftime_cached(date_obj: datetime, utcoffset: Optional[timedelta], date_format: str) -> str:
+    """
+    strftime, memoized across tickets.
+
+    Aware datetimes compare equal by instant alone, so the UTC offset is part
+    of the key to keep the formatted wall-clock time exact.
+    """
+    return date_obj.strftime(date_format)
 
 
 class MarkdownConverter:
     """Converts JIRA ticket data to Markdown format."""
 
+    # JIRA markup patterns, compiled once and shared by every conversion
+    CODE_PATTERN = re.compile(r'\{code:?([^}]*)\}(.*?)\{code\}', re.DOTALL)
+    NOFORMAT_PATTERN = re.compile(r'\{noformat\}(.*?)\{noformat\}', re.DOTALL)
+    QUOTE_PATTERN = re.compile(r'\{quote\}(.*?)\{quote\}', re.DOTALL)
+    HEADER_PATTERN = re.compile(r'^h([1-6])\. (.+)$', re.MULTILINE)
+    BOLD_PATTERN = re.compile(r'\*(\S.*?)\*')
+    ITALIC_PATTERN = re.compile(r'_(\S.*?)_')
+    STRIKETHROUGH_PATTERN = re.compile(r'-(\S.*?)-')
+    IMAGE_PATTERN = re.compile(r'!([^|!\n]+)(?:\|[^!]*)?!')
+    MONOSPACE_PATTERN = re.compile(r'\{\{(.*?)\}\}')
+    UNDERLINE_PATTERN = re.compile(r'\+(\S.*?)\+')
+    LINK_PATTERN = re.compile(r'\[([^|\]]+)\|([^\]]+)\]')
+    BULLET_PATTERN = re.compile(r'^- ', re.MULTILINE)
+
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
     def __init__(self, config):
         """
         Initialize markdown converter.
@@ -21,6 +49,20 @@ class MarkdownConverter:
         self.config = config
         self.logger = logging.getLogger(__name__)
 
+        # Settings read once rather than walked out of the config per ticket
+        self.include_metadata_table = config.get('markdown.include_metadata_table', True)
+        self.include_comments = config.get('markdown.include_comments', True)
+        self.include_attachments = config.get('markdown.include_attachments', True)
+        self.include_subtasks = config.get('markdown.include_subtasks', True)
+        self.include_links = config.get('markdown.include_links', True)
+        self.convert_markup = config.get('markdown.convert_markup', True)
+        self.date_format = config.get('markdown.date_format', '%Y-%m-%d %H:%M:%S')
+        self.jira_url = config.jira_url
+
+        # One generation time per run, so it is formatted only once
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._footer = f"---\n*Generated on {generated} by JIRA to Markdown Converter*"
+
     def convert(self, ticket_data: Dict[str, Any]) -> str:
         """
         Convert ticket data to markdown string.
@@ -31,56 +73,57 @@ class MarkdownConverter:
         Returns:
             Markdown formatted string
         """
-        sections = []
+        # Every section contributes its lines to one list, joined once
+        lines = []
 
         # Title
-        sections.append(self._render_title(ticket_data))
-        sections.append("")
+        lines.append(self._render_title(ticket_data))
+        lines.append("")
 
         # Metadata table
-        if self.config.get('markdown.include_metadata_table', True):
-            sections.append(self._render_metadata_table(ticket_data))
-            sections.append("")
+        if self.include_metadata_table:
+            lines.extend(self._metadata_table_lines(ticket_data))
+            lines.append("")
 
         # Description
         if ticket_data.get('description'):
-            sections.append("## Description\n")
-            sections.append(self._render_description(ticket_data['description'], ticket_data.get('attachments')))
-            sections.append("")
+            lines.append("## Description\n")
+            lines.append(self._render_description(ticket_data['description'], ticket_data.get('attachments')))
+            lines.append("")
 
         # Comments
-        if (self.config.get('markdown.include_comments', True) and
+        if (self.include_comments and
             ticket_data.get('comments')):
-            sections.append(self._render_comments(ticket_data['comments']))
-            sections.append("")
+            lines.extend(self._comment_lines(ticket_data['comments']))
+            lines.append("")
 
         # Custom fields
         if ticket_data.get('custom_fields'):
-            sections.append(self._render_custom_fields(ticket_data['custom_fields']))
-            sections.append("")
+            lines.extend(self._custom_field_lines(ticket_data['custom_fields']))
+            lines.append("")
 
         # Attachments
-        if (self.config.get('markdown.include_attachments', True) and
+        if (self.include_attachments and
             ticket_data.get('attachments')):
-            sections.append(self._render_attachments(ticket_data['attachments']))
-            sections.append("")
+            lines.extend(self._attachment_lines(ticket_data['attachments']))
+            lines.append("")
 
         # Subtasks
-        if (self.config.get('markdown.include_subtasks', True) and
+        if (self.include_subtasks and
             ticket_data.get('subtasks')):
-            sections.append(self._render_subtasks(ticket_data['subtasks']))
-            sections.append("")
+            lines.extend(self._subtask_lines(ticket_data['subtasks']))
+            lines.append("")
 
         # Links
-        if (self.config.get('markdown.include_links', True) and
+        if (self.include_links and
             (ticket_data.get('links') or ticket_data.get('parent'))):
-            sections.append(self._render_links(ticket_data))
-            sections.append("")
+            lines.extend(self._link_lines(ticket_data))
+            lines.append("")
 
         # Footer
-        sections.append(self._render_footer())
+        lines.append(self._render_footer())
 
-        return "\n".join(sections)
+        return "\n".join(lines)
 
     def _render_title(self, ticket_data: Dict[str, Any]) -> str:
         """Render the title."""
@@ -90,8 +133,10 @@ class MarkdownConverter:
 
     def _render_metadata_table(self, ticket_data: Dict[str, Any]) -> str:
         """Render metadata as a table."""
-        lines = ["## Metadata\n", "| Field | Value |", "|-------|-------|"]
+        return "\n".join(self._metadata_table_lines(ticket_data))
 
+    def _metadata_table_lines(self, ticket_data: Dict[str, Any]) -> List[str]:
+        """Lines of the metadata table."""
         # Key fields
         metadata = [
             ("Key", ticket_data['key']),
@@ -112,7 +157,7 @@ class MarkdownConverter:
             metadata.append(("Reporter", reporter['name']))
 
         # Dates
-        date_format = self.config.get('markdown.date_format', '%Y-%m-%d %H:%M:%S')
+        date_format = self.date_format
 
         if ticket_data.get('created'):
             metadata.append(("Created", self._format_date(ticket_data['created'], date_format)))
@@ -142,28 +187,35 @@ class MarkdownConverter:
             metadata.append(("Affects Versions", ", ".join(ticket_data['affects_versions'])))
 
         # Add to table
-        for field, value in metadata:
-            # Escape pipe characters in values
-            value_str = str(value).replace('|', '\\|')
-            lines.append(f"| **{field}** | {value_str} |")
+        lines = ["## Metadata\n", "| Field | Value |", "|-------|-------|"]
+        lines.extend(f"| **{field}** | {self._escape_table_cell(value)} |" for field, value in metadata)
 
-        return "\n".join(lines)
+        return lines
+
+    @staticmethod
+    def _escape_table_cell(value: Any) -> str:
+        """Escape pipe characters and flatten line breaks that would end the table row."""
+        return str(value).replace('|', '\\|').replace('\n', ' ')
 
     def _render_description(self, description: str, attachments: List[Dict[str, Any]] = None) -> str:
         """Render description with JIRA markup conversion."""
         if not description:
             return "_No description provided._"
 
-        if self.config.get('markdown.convert_markup', True):
+        if self.convert_markup:
             description = self._convert_jira_markup(description, attachments)
 
         return description
 
     def _render_comments(self, comments: List[Dict[str, Any]]) -> str:
         """Render comments section."""
+        return "\n".join(self._comment_lines(comments))
+
+    def _comment_lines(self, comments: List[Dict[str, Any]]) -> List[str]:
+        """Lines of the comments section."""
         lines = ["## Comments\n"]
 
-        date_format = self.config.get('markdown.date_format', '%Y-%m-%d %H:%M:%S')
+        date_format = self.date_format
 
         for comment in comments:
             author = comment.get('author', {})
@@ -174,57 +226,57 @@ class MarkdownConverter:
             lines.append(f"### {author_name} - {created_str}\n")
 
             body = comment.get('body', '')
-            if self.config.get('markdown.convert_markup', True):
+            if self.convert_markup:
                 body = self._convert_jira_markup(body)
 
             lines.append(body)
             lines.append("")
 
-        return "\n".join(lines)
+        return lines
 
     def _render_custom_fields(self, custom_fields: Dict[str, Any]) -> str:
         """Render custom fields."""
-        lines = ["## Custom Fields\n"]
-
-        for field_name, value in sorted(custom_fields.items()):
-            if isinstance(value, list):
-                value_str = ", ".join(str(v) for v in value)
-            else:
-                value_str = str(value)
-
-            lines.append(f"- **{field_name}**: {value_str}")
+        return "\n".join(self._custom_field_lines(custom_fields))
 
-        return "\n".join(lines)
+    def _custom_field_lines(self, custom_fields: Dict[str, Any]) -> List[str]:
+        """Lines of the custom fields."""
+        return ["## Custom Fields\n"] + [
+            f"- **{field_name}**: {', '.join(map(str, value)) if isinstance(value, list) else str(value)}"
+            for field_name, value in sorted(custom_fields.items())
+        ]
 
     def _render_attachments(self, attachments: List[Dict[str, Any]]) -> str:
         """Render attachments section."""
-        lines = ["## Attachments\n"]
-
-        for attachment in attachments:
-            filename = attachment['filename']
-            size = self._format_size(attachment['size'])
-            url = attachment['url']
-            lines.append(f"- [{filename}]({url}) ({size})")
-
-        return "\n".join(lines)
+        return "\n".join(self._attachment_lines(attachments))
+
+    def _attachment_lines(self, attachments: List[Dict[str, Any]]) -> List[str]:
+        """Lines of the attachments section."""
+        format_size = self._format_size
+        return ["## Attachments\n"] + [
+            f"- [{attachment['filename']}]({attachment['url']}) ({format_size(attachment['size'])})"
+            for attachment in attachments
+        ]
 
     def _render_subtasks(self, subtasks: List[str]) -> str:
         """Render subtasks section."""
-        lines = ["## Subtasks\n"]
+        return "\n".join(self._subtask_lines(subtasks))
 
-        for subtask_key in subtasks:
-            lines.append(f"- [ ] {subtask_key}")
-
-        return "\n".join(lines)
+    def _subtask_lines(self, subtasks: List[str]) -> List[str]:
+        """Lines of the subtasks section."""
+        return ["## Subtasks\n"] + [f"- [ ] {subtask_key}" for subtask_key in subtasks]
 
     def _render_links(self, ticket_data: Dict[str, Any]) -> str:
         """Render links section."""
+        return "\n".join(self._link_lines(ticket_data))
+
+    def _link_lines(self, ticket_data: Dict[str, Any]) -> List[str]:
+        """Lines of the links section."""
         lines = ["## Links\n"]
 
         # Parent issue
         if ticket_data.get('parent'):
             parent_key = ticket_data['parent']
-            parent_url = f"{self.config.jira_url}/browse/{parent_key}"
+            parent_url = f"{self.jira_url}/browse/{parent_key}"
             lines.append(f"- **Parent Issue**: [{parent_key}]({parent_url})")
 
         # Issue links
@@ -236,7 +288,7 @@ class MarkdownConverter:
                 direction = link.get('direction', '')
 
                 if link_key:
-                    link_url = f"{self.config.jira_url}/browse/{link_key}"
+                    link_url = f"{self.jira_url}/browse/{link_key}"
                     lines.append(f"- **{link_type}** ({direction}): [{link_key}]({link_url}) - {link_summary}")
 
         # View in JIRA
@@ -244,12 +296,11 @@ class MarkdownConverter:
         if jira_url:
             lines.append(f"\n- **View in JIRA**: [{ticket_data['key']}]({jira_url})")
 
-        return "\n".join(lines)
+        return lines
 
     def _render_footer(self) -> str:
         """Render footer."""
-        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        return f"---\n*Generated on {now} by JIRA to Markdown Converter*"
+        return self._footer
 
     def _convert_jira_markup(self, text: str, attachments: List[Dict[str, Any]] = None) -> str:
         """
@@ -265,67 +316,82 @@ class MarkdownConverter:
         if not text:
             return ""
 
-        # Build attachment lookup map (normalize filenames for matching)
-        attachment_map = {}
-        if attachments:
-            for att in attachments:
-                filename = att.get('filename', '')
-                url = att.get('url', '')
-                # Store with original filename
-                attachment_map[filename] = url
-                # Also store normalized version (tildes to dashes)
-                normalized = filename.replace('~~', '-').replace('~', '-')
-                attachment_map[normalized] = url
+        # Each pass works on the output of the ones before it, so they stay
+        # separate; a pass is skipped outright when the text doesn't contain
+        # the literal its pattern needs, which is far cheaper than a regex
+        # scan that finds nothing
 
         # Code blocks (must be first to avoid affecting other conversions)
-        text = re.sub(r'\{code:?([^}]*)\}(.*?)\{code\}',
-                     lambda m: f"```{m.group(1).strip()}\n{m.group(2)}\n```",
-                     text, flags=re.DOTALL)
+        if '{code' in text:
+            text = self.CODE_PATTERN.sub(
+                lambda m: f"```{m.group(1).strip()}\n{m.group(2)}\n```", text
+            )
 
         # Noformat blocks
-        text = re.sub(r'\{noformat\}(.*?)\{noformat\}',
-                     r'```\n\1\n```', text, flags=re.DOTALL)
+        if '{noformat}' in text:
+            text = self.NOFORMAT_PATTERN.sub(r'```\n\1\n```', text)
 
         # Quote blocks
-        text = re.sub(r'\{quote\}(.*?)\{quote\}',
-                     lambda m: '\n'.join(f'> {line}' for line in m.group(1).strip().split('\n')),
-                     text, flags=re.DOTALL)
+        if '{quote}' in text:
+            text = self.QUOTE_PATTERN.sub(
+                lambda m: '\n'.join(f'> {line}' for line in m.group(1).strip().split('\n')), text
+            )
 
-        # Headers (h1-h6)
-        for i in range(1, 7):
-            text = re.sub(f'^h{i}\\. (.+)$', '#' * i + r' \1', text, flags=re.MULTILINE)
+        # Headers (h1-h6), all levels in one pass
+        if '. ' in text:
+            text = self.HEADER_PATTERN.sub(lambda m: f"{'#' * int(m.group(1))} {m.group(2)}", text)
 
         # Bold
-        text = re.sub(r'\*(\S.*?)\*', r'**\1**', text)
+        if '*' in text:
+            text = self.BOLD_PATTERN.sub(r'**\1**', text)
 
         # Italic
-        text = re.sub(r'_(\S.*?)_', r'*\1*', text)
+        if '_' in text:
+            text = self.ITALIC_PATTERN.sub(r'*\1*', text)
 
         # Strikethrough
-        text = re.sub(r'-(\S.*?)-', r'~~\1~~', text)
+        if '-' in text:
+            text = self.STRIKETHROUGH_PATTERN.sub(r'~~\1~~', text)
 
         # Images !filename! or !filename|attrs! (after strikethrough to avoid dash conversion)
-        def replace_image(match):
-            filename = match.group(1)
-            # Normalize filename (Jira uses ~~ in markup but - in actual filename)
-            normalized_filename = filename.replace('~~', '-').replace('~', '-')
-            # Try to find attachment URL
-            url = attachment_map.get(filename) or attachment_map.get(normalized_filename) or normalized_filename
-            return f'![{normalized_filename}]({url})'
-
-        text = re.sub(r'!([^|!\n]+)(?:\|[^!]*)?!', replace_image, text)
+        if '!' in text:
+            # Build attachment lookup map (normalize filenames for matching)
+            attachment_map = {}
+            if attachments:
+                for att in attachments:
+                    filename = att.get('filename', '')
+                    url = att.get('url', '')
+                    # Store with original filename
+                    attachment_map[filename] = url
+                    # Also store normalized version (tildes to dashes)
+                    normalized = filename.replace('~~', '-').replace('~', '-')
+                    attachment_map[normalized] = url
+
+            def replace_image(match):
+                filename = match.group(1)
+                # Normalize filename (Jira uses ~~ in markup but - in actual filename)
+                normalized_filename = filename.replace('~~', '-').replace('~', '-')
+                # Try to find attachment URL
+                url = attachment_map.get(filename) or attachment_map.get(normalized_filename) or normalized_filename
+                return f'![{normalized_filename}]({url})'
+
+            text = self.IMAGE_PATTERN.sub(replace_image, text)
 
         # Monospace
-        text = re.sub(r'\{\{(.*?)\}\}', r'`\1`', text)
+        if '{{' in text:
+            text = self.MONOSPACE_PATTERN.sub(r'`\1`', text)
 
         # Underline (no direct Markdown equivalent, use emphasis)
-        text = re.sub(r'\+(\S.*?)\+', r'*\1*', text)
+        if '+' in text:
+            text = self.UNDERLINE_PATTERN.sub(r'*\1*', text)
 
         # Links [text|url]
-        text = re.sub(r'\[([^|\]]+)\|([^\]]+)\]', r'[\1](\2)', text)
+        if '[' in text:
+            text = self.LINK_PATTERN.sub(r'[\1](\2)', text)
 
         # Bulleted lists (convert - to *)
-        text = re.sub(r'^- ', r'* ', text, flags=re.MULTILINE)
+        if '- ' in text:
+            text = self.BULLET_PATTERN.sub(r'* ', text)
 
         # Numbered lists are already compatible
 
@@ -337,13 +403,14 @@ class MarkdownConverter:
     def _format_date(self, date_obj: datetime, date_format: str) -> str:
         """Format datetime object as string."""
         if isinstance(date_obj, datetime):
-            return date_obj.strftime(date_format)
+            return _strftime_cached(date_obj, date_obj.utcoffset(), date_format)
         return str(date_obj)
 
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} B"
+
+        # Each unit is 10 bits up, so the bit length picks it directly
+        unit = min((int(size_bytes).bit_length() - 1) // 10, len(self.SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * unit)):.1f} {self.SIZE_UNITS[unit]}"
@@ -2,15 +2,29 @@
 Ticket retrieval and data extraction logic.
 """
 
+import re
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 from dateutil import parser as date_parser
 
+from .jira_client import JiraConnectionError
+
 
 class TicketFetcher:
     """Handles fetching and extracting ticket data from JIRA."""
 
+    # Keys fetched per 'issuekey in (...)' search in fetch_bulk
+    BULK_BATCH_SIZE = 100
+    # Only keys of this shape are put into JQL; anything else is fetched on its own
+    TICKET_KEY_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*-\d+$')
+    # Users remembered by _extract_user before the cache is started over
+    USER_CACHE_SIZE = 10000
+    # One dateutil parser for every date of every ticket; parse() keeps no
+    # state between calls, so it is safe to share across threads
+    DATE_PARSER = date_parser.parser()
+
     def __init__(self, jira_client):
         """
         Initialize ticket fetcher.
@@ -21,11 +35,18 @@ class TicketFetcher:
         self.jira_client = jira_client
         self.logger = logging.getLogger(__name__)
         self._custom_field_mapping = None
+        # (field_id, field_name) pairs of the mapping, iterated for every ticket
+        self._custom_field_items: Optional[Tuple[Tuple[str, str], ...]] = None
+        # Extracted users by account id (Cloud) or key (Server); the same
+        # people author most comments and own most tickets in a run
+        self._user_cache: Dict[str, Dict[str, str]] = {}
 
     def _get_custom_field_mapping(self) -> Dict[str, str]:
         """Get or fetch custom field mapping."""
         if self._custom_field_mapping is None:
-            self._custom_field_mapping = self.jira_client.get_custom_fields()
+            mapping = self.jira_client.get_custom_fields()
+            self._custom_field_items = tuple(mapping.items())
+            self._custom_field_mapping = mapping
         return self._custom_field_mapping
 
     def fetch_single(self, ticket_key: str) -> Dict[str, Any]:
@@ -62,28 +83,109 @@ class TicketFetcher:
 
         return [self._extract_ticket_data(issue) for issue in issues]
 
-    def fetch_bulk(self, ticket_keys: List[str]) -> List[Dict[str, Any]]:
+    def stream_by_jql(self, jql: str,
+                      max_results: Optional[int] = None) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Fetch tickets using JQL query, yielding them as pages arrive.
+
+        The first page is requested up front so the number of matching
+        tickets is known before any ticket is processed; after that, the
+        next page is always being fetched while the current one is consumed.
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum number of results (None for all)
+
+        Returns:
+            Tuple of (number of matching tickets, iterator of ticket data dictionaries)
+        """
+        self.logger.info(f"Fetching tickets with JQL: {jql}")
+
+        pages = self.jira_client.iter_search_pages(jql, max_results=max_results)
+        first_page = next(pages, None)
+        if first_page is None:
+            return 0, iter(())
+
+        total = first_page.total
+        if max_results:
+            total = min(total, max_results)
+
+        def tickets():
+            # Each page's successor is requested in the background while its
+            # tickets are extracted and consumed, so the caller doesn't stall
+            # on a page fetch between pages
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                page = first_page
+                while page is not None:
+                    next_page = prefetcher.submit(next, pages, None)
+                    for issue in page:
+                        yield self._extract_ticket_data(issue)
+                    page = next_page.result()
+
+        return total, tickets()
+
+    def fetch_bulk(self, ticket_keys: List[str], max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Fetch multiple specific tickets.
 
+        Tickets are requested up to BULK_BATCH_SIZE at a time with an
+        'issuekey in (...)' search; keys a search doesn't return (unknown,
+        not permitted, or a batch JIRA rejected) are then fetched one by one.
+
         Args:
             ticket_keys: List of ticket keys
+            max_workers: Number of requests made concurrently
 
         Returns:
-            List of ticket data dictionaries
+            List of ticket data dictionaries, in the order of ticket_keys;
+            tickets that failed to fetch are left out
         """
         self.logger.info(f"Fetching {len(ticket_keys)} tickets")
-        tickets = []
 
-        for key in ticket_keys:
+        batchable = list(dict.fromkeys(
+            key.upper() for key in ticket_keys if self.TICKET_KEY_PATTERN.match(key)
+        ))
+        batches = [
+            batchable[i:i + self.BULK_BATCH_SIZE]
+            for i in range(0, len(batchable), self.BULK_BATCH_SIZE)
+        ]
+
+        def fetch(key: str) -> Optional[Dict[str, Any]]:
             try:
-                ticket = self.fetch_single(key)
-                tickets.append(ticket)
+                return self.fetch_single(key)
             except Exception as e:
                 self.logger.error(f"Failed to fetch {key}: {e}")
-                continue
+                return None
 
-        return tickets
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        run = executor.map if executor else map
+
+        try:
+            tickets: Dict[str, Dict[str, Any]] = {}
+            for issues in run(self._search_batch, batches):
+                for issue in issues:
+                    tickets[issue.key] = self._extract_ticket_data(issue)
+
+            missing = [key for key in dict.fromkeys(key.upper() for key in ticket_keys)
+                       if key not in tickets]
+            for key, ticket in zip(missing, run(fetch, missing)):
+                if ticket is not None:
+                    tickets[key] = ticket
+        finally:
+            if executor:
+                executor.shutdown()
+
+        return [tickets[key.upper()] for key in ticket_keys if key.upper() in tickets]
+
+    def _search_batch(self, keys: List[str]) -> List[Any]:
+        """Search for a batch of tickets by key, or return none if JIRA rejects the search."""
+        jql = f"issuekey in ({', '.join(keys)})"
+        try:
+            return self.jira_client.search_issues(jql, max_results=len(keys))
+        except JiraConnectionError as e:
+            # JIRA fails the whole search if any key doesn't exist
+            self.logger.debug(f"Batch of {len(keys)} tickets failed, fetching them one by one: {e}")
+            return []
 
     def _extract_ticket_data(self, issue) -> Dict[str, Any]:
         """
@@ -102,9 +204,9 @@ class TicketFetcher:
             'key': issue.key,
             'summary': fields.summary or '',
             'description': fields.description or '',
-            'status': str(fields.status) if fields.status else '',
-            'issue_type': str(fields.issuetype) if fields.issuetype else '',
-            'priority': str(fields.priority) if fields.priority else '',
+            'status': self._resource_name(fields.status) if fields.status else '',
+            'issue_type': self._resource_name(fields.issuetype) if fields.issuetype else '',
+            'priority': self._resource_name(fields.priority) if fields.priority else '',
         }
 
         # People
@@ -120,12 +222,12 @@ class TicketFetcher:
 
         # Lists
         data['labels'] = fields.labels or []
-        data['components'] = [str(c) for c in fields.components] if fields.components else []
-        data['fix_versions'] = [str(v) for v in fields.fixVersions] if fields.fixVersions else []
-        data['affects_versions'] = [str(v) for v in getattr(fields, 'versions', [])] if hasattr(fields, 'versions') else []
+        data['components'] = [self._resource_name(c) for c in fields.components] if fields.components else []
+        data['fix_versions'] = [self._resource_name(v) for v in fields.fixVersions] if fields.fixVersions else []
+        data['affects_versions'] = [self._resource_name(v) for v in getattr(fields, 'versions', [])] if hasattr(fields, 'versions') else []
 
         # Resolution
-        data['resolution'] = str(fields.resolution) if fields.resolution else None
+        data['resolution'] = self._resource_name(fields.resolution) if fields.resolution else None
 
         # Parent/subtasks
         data['parent'] = getattr(fields, 'parent', None)
@@ -158,18 +260,36 @@ class TicketFetcher:
         if not user:
             return None
 
-        return {
+        user_id = getattr(user, 'accountId', None) or getattr(user, 'key', None)
+        cached = self._user_cache.get(user_id) if user_id else None
+        if cached is not None:
+            return cached
+
+        extracted = {
             'name': getattr(user, 'displayName', None) or getattr(user, 'name', 'Unknown'),
             'email': getattr(user, 'emailAddress', None) or ''
         }
 
+        if user_id:
+            if len(self._user_cache) >= self.USER_CACHE_SIZE:
+                self._user_cache.clear()
+            self._user_cache[user_id] = extracted
+        return extracted
+
+    @staticmethod
+    def _resource_name(resource) -> str:
+        """Name of a named JIRA resource (status, priority, version, ...)."""
+        # A plain attribute load; str() on a Resource walks its raw dict
+        # for a readable id, which lands on the same name
+        return getattr(resource, 'name', None) or str(resource)
+
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """Parse date string to datetime object."""
         if not date_str:
             return None
 
         try:
-            return date_parser.parse(date_str)
+            return self.DATE_PARSER.parse(date_str)
         except Exception as e:
             self.logger.warning(f"Failed to parse date '{date_str}': {e}")
             return None
@@ -240,20 +360,31 @@ class TicketFetcher:
     def _extract_custom_fields(self, issue) -> Dict[str, Any]:
         """Extract custom fields with friendly names."""
         custom_fields = {}
-        mapping = self._get_custom_field_mapping()
+        self._get_custom_field_mapping()
 
         try:
-            for field_id, field_name in mapping.items():
-                if hasattr(issue.fields, field_id):
-                    value = getattr(issue.fields, field_id)
-                    if value is not None:
-                        # Convert complex objects to strings
-                        if isinstance(value, (list, tuple)):
-                            value = [str(v) for v in value]
-                        elif not isinstance(value, (str, int, float, bool)):
-                            value = str(value)
-
-                        custom_fields[field_name] = value
+            # Plain dict lookups rather than hasattr/getattr for each of the
+            # (often hundreds of) custom fields
+            field_values = getattr(issue.fields, '__dict__', None)
+            if field_values is None:
+                field_values = {
+                    field_id: getattr(issue.fields, field_id)
+                    for field_id, _ in self._custom_field_items
+                    if hasattr(issue.fields, field_id)
+                }
+
+            for field_id, field_name in self._custom_field_items:
+                value = field_values.get(field_id)
+                if value is None:
+                    continue
+
+                # Convert complex objects to strings
+                if isinstance(value, (list, tuple)):
+                    value = [str(v) for v in value]
+                elif not isinstance(value, (str, int, float, bool)):
+                    value = str(value)
+
+                custom_fields[field_name] = value
         except Exception as e:
             self.logger.warning(f"Failed to extract custom fields: {e}")
 
@@ -0,0 +1,114 @@
+"""Shared test fixtures."""
+
+import threading
+import pytest
+from jira.exceptions import JIRAError
+
+
+class Page(list):
+    """Search result page shaped like jira's ResultList."""
+
+    def __init__(self, issues, total=None, next_token=None):
+        super().__init__(issues)
+        self.total = len(issues) if total is None else total
+        self.nextPageToken = next_token
+
+
+class CloudJira:
+    """Fake Jira Cloud: pages by token, reports only the page length as total."""
+
+    def __init__(self, count):
+        self.issues = [f"PROJ-{i}" for i in range(count)]
+        # Page starts in request order, and an event per start once requested
+        self.requests = []
+        self.requested = {}
+
+    def enhanced_search_issues(self, jql, nextPageToken=None, maxResults=50, fields=None):
+        start = int(nextPageToken) if nextPageToken else 0
+        self.requests.append(start)
+        self.requested.setdefault(start, threading.Event()).set()
+        issues = self.issues[start:start + maxResults]
+        end = start + len(issues)
+        return Page(issues, next_token=str(end) if end < len(self.issues) else None)
+
+    def search_issues(self, jql, startAt=0, maxResults=50, fields=None):
+        if startAt:
+            raise JIRAError("The `search` API is deprecated in Jira Cloud.")
+        return self.enhanced_search_issues(jql, maxResults=maxResults, fields=fields)
+
+    def approximate_issue_count(self, jql):
+        return len(self.issues)
+
+    def was_requested(self, start, timeout=2):
+        """Wait for the page at start to be requested, from whichever thread."""
+        return self.requested.setdefault(start, threading.Event()).wait(timeout)
+
+
+class ServerJira:
+    """Fake Jira Server: pages by offset and reports the real total."""
+
+    def __init__(self, count):
+        self.issues = [f"PROJ-{i}" for i in range(count)]
+
+    def search_issues(self, jql, startAt=0, maxResults=50, fields=None):
+        return Page(self.issues[startAt:startAt + maxResults], total=len(self.issues))
+
+
+class MockConfig:
+    """Mock config for testing."""
+
+    def __init__(self):
+        self._config = {
+            'markdown': {
+                'include_metadata_table': True,
+                'include_comments': True,
+                'include_attachments': True,
+                'include_subtasks': True,
+                'include_links': True,
+                'date_format': '%Y-%m-%d %H:%M:%S',
+                'convert_markup': True
+            },
+            'jira': {
+                'url': 'https://test.atlassian.net'
+            }
+        }
+
+    def get(self, key, default=None):
+        keys = key.split('.')
+        value = self._config
+        for k in keys:
+            if isinstance(value, dict):
+                value = value.get(k)
+                if value is None:
+                    return default
+            else:
+                return default
+        return value
+
+    @property
+    def jira_url(self):
+        return 'https://test.atlassian.net'
+
+
+@pytest.fixture
+def mock_config():
+    """Config with every markdown section enabled."""
+    return MockConfig()
+
+
+@pytest.fixture
+def cloud_jira():
+    """Fake Jira Cloud with 120 matching issues."""
+    return CloudJira(120)
+
+
+@pytest.fixture
+def server_jira():
+    """Fake Jira Server with 120 matching issues."""
+    return ServerJira(120)
+
+
+@pytest.fixture(params=['cloud_jira', 'server_jira'])
+def paged_jira(request):
+    """Each fake JIRA deployment in turn."""
+    return request.getfixturevalue(request.param)
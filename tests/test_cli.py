@@ -0,0 +1,52 @@
+"""Tests for the command-line interface."""
+
+import pytest
+from click.testing import CliRunner
+from jira_to_markdown.cli import cli
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """CLI runner working in an empty directory with JIRA credentials set."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('JIRA_URL', 'https://test.atlassian.net')
+    monkeypatch.setenv('JIRA_USERNAME', 'user@example.com')
+    monkeypatch.setenv('JIRA_API_TOKEN', 'token')
+    return CliRunner()
+
+
+def test_download_images_dry_run_missing_directory(runner):
+    """Test that a dry run over a missing directory reports nothing to do."""
+    result = runner.invoke(cli, ['download-images', '-d', 'missing', '-i', 'images', '--dry-run'])
+
+    assert result.exit_code == 0, result.output
+    assert "Total: 0 remote images found in 0 files (0 unique to download)" in result.output
+
+
+def test_download_images_dry_run_counts_remote_images(runner, tmp_path):
+    """Test that a dry run lists remote images per file without downloading."""
+    (tmp_path / 'out').mkdir()
+    (tmp_path / 'out' / 'PROJ-1.md').write_text(
+        "![a](https://ext.example/a.png)\n![a](https://ext.example/a.png)\n![l](images/l.png)\n"
+    )
+
+    result = runner.invoke(cli, ['download-images', '-d', 'out', '-i', 'images', '--dry-run'])
+
+    assert result.exit_code == 0, result.output
+    assert "PROJ-1.md: 2 remote image(s)" in result.output
+    assert "Total: 2 remote images found in 1 files (1 unique to download)" in result.output
+    assert not (tmp_path / 'images').exists()
+
+
+@pytest.mark.parametrize('command', [
+    ['fetch', 'PROJ-1'],
+    ['query', 'project = PROJ'],
+    ['bulk', 'PROJ-1'],
+    ['download-images', '--dry-run'],
+])
+def test_image_workers_must_be_positive(runner, command):
+    """Test that --image-workers 0 is rejected before any work starts."""
+    result = runner.invoke(cli, command + ['--image-workers', '0'])
+
+    assert result.exit_code == 2
+    assert "--image-workers" in result.output
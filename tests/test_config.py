@@ -0,0 +1,59 @@
+"""Tests for configuration loading."""
+
+import os
+import pytest
+from jira_to_markdown.config import Config
+
+
+CONFIG_YAML = """\
+jira:
+  url: https://{host}.atlassian.net
+output:
+  directory: ./{host}
+"""
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    """Provide the JIRA credentials validation requires, and nothing else."""
+    monkeypatch.delenv('JIRA_URL', raising=False)
+    monkeypatch.setenv('JIRA_USERNAME', 'user@example.com')
+    monkeypatch.setenv('JIRA_API_TOKEN', 'token')
+
+
+def write_config(path, host, mtime_ns):
+    with open(path, 'w') as f:
+        f.write(CONFIG_YAML.format(host=host))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_edited_config_is_reloaded(tmp_path, credentials):
+    """Test that a config file edited since it was cached is parsed again."""
+    path = str(tmp_path / 'config.yaml')
+
+    write_config(path, 'first', 1_700_000_000_000_000_000)
+    assert Config(path, load_env=False).jira_url == 'https://first.atlassian.net'
+
+    # Same size, so only the changed mtime marks the cached parse as stale
+    write_config(path, 'other', 1_700_000_001_000_000_000)
+    assert Config(path, load_env=False).jira_url == 'https://other.atlassian.net'
+
+
+def test_cached_config_is_not_shared(tmp_path, credentials, monkeypatch):
+    """Test that changes to one Config never reach another loaded from the same file."""
+    path = str(tmp_path / 'config.yaml')
+    write_config(path, 'first', 1_700_000_000_000_000_000)
+
+    # The first load parses and caches the file, the second is served from
+    # the cache; neither may leak its changes into the cached copy
+    monkeypatch.setenv('JIRA_URL', 'https://override.atlassian.net')
+    for _ in range(2):
+        overridden = Config(path, load_env=False)
+        overridden.set('output.directory', './elsewhere')
+    monkeypatch.delenv('JIRA_URL')
+
+    config = Config(path, load_env=False)
+
+    assert overridden.jira_url == 'https://override.atlassian.net'
+    assert config.jira_url == 'https://first.atlassian.net'
+    assert config.get('output.directory') == './first'
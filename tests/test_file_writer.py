@@ -4,7 +4,10 @@ import pytest
 import os
 import tempfile
 import shutil
+from datetime import datetime
+from jira_to_markdown import markdown_converter
 from jira_to_markdown.file_writer import FileWriter, FileWriteError
+from jira_to_markdown.markdown_converter import MarkdownConverter
 
 
 @pytest.fixture
@@ -126,3 +129,160 @@ def test_atomic_write(writer, temp_dir):
     # Ensure no temp files are left
     temp_files = [f for f in os.listdir(temp_dir) if f.startswith('.') and f.endswith('.tmp')]
     assert len(temp_files) == 0
+
+
+def test_write_ticket_unicode(writer, temp_dir):
+    """Test that non-ASCII content is written as UTF-8."""
+    content = "# Résumé ✓\n\n日本語のテキスト"
+    filepath = writer.write_ticket('TEST-123', content)
+
+    with open(filepath, 'rb') as f:
+        assert f.read() == content.encode('utf-8')
+
+
+def test_atomic_write_with_fsync(temp_dir):
+    """Test atomic write with fsync enabled."""
+    writer = FileWriter(temp_dir, fsync=True)
+    filepath = writer.write_ticket('TEST-123', "Synced content")
+
+    with open(filepath, 'r') as f:
+        assert f.read() == "Synced content"
+
+    temp_files = [f for f in os.listdir(temp_dir) if f.endswith('.tmp')]
+    assert len(temp_files) == 0
+
+
+def test_write_multiple(writer, temp_dir):
+    """Test writing several tickets."""
+    tickets = {f'TEST-{i}': (f"# Ticket {i}", None) for i in range(20)}
+
+    written = writer.write_multiple(tickets)
+
+    assert written == [os.path.join(temp_dir, f'TEST-{i}.md') for i in range(20)]
+    with open(os.path.join(temp_dir, 'TEST-7.md'), 'r') as f:
+        assert f.read() == "# Ticket 7"
+
+
+def test_existing_files_listed_at_init(temp_dir):
+    """Test that files present before the writer was created are not overwritten."""
+    with open(os.path.join(temp_dir, 'TEST-123.md'), 'w') as f:
+        f.write("Original")
+
+    writer = FileWriter(temp_dir, overwrite=False)
+    assert writer.file_exists('TEST-123')
+
+    writer.write_ticket('TEST-123', "Replacement")
+    with open(os.path.join(temp_dir, 'TEST-123.md'), 'r') as f:
+        assert f.read() == "Original"
+
+
+def test_concurrent_writes_same_ticket(writer, temp_dir):
+    """Test that concurrent writes of one ticket write it exactly once."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    contents = [f"Content {i}" for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda c: writer.write_ticket('TEST-123', c), contents))
+
+    with open(os.path.join(temp_dir, 'TEST-123.md'), 'r') as f:
+        assert f.read() in contents
+    assert os.listdir(temp_dir) == ['TEST-123.md']
+
+
+def test_overwrite_skips_unchanged_content(temp_dir):
+    """Test that overwriting with identical content leaves the file alone."""
+    writer = FileWriter(temp_dir, overwrite=True)
+    filepath = writer.write_ticket('TEST-123', "Same content")
+    writer.close()
+    mtime = os.stat(filepath).st_mtime_ns
+
+    writer = FileWriter(temp_dir, overwrite=True)
+    writer.write_ticket('TEST-123', "Same content")
+    assert os.stat(filepath).st_mtime_ns == mtime
+
+    writer.write_ticket('TEST-123', "New content")
+    with open(filepath, 'r') as f:
+        assert f.read() == "New content"
+
+
+def test_overwrite_rewrites_edited_file(temp_dir):
+    """Test that a file edited since it was written is replaced again."""
+    writer = FileWriter(temp_dir, overwrite=True)
+    filepath = writer.write_ticket('TEST-123', "Same content")
+    writer.close()
+
+    with open(filepath, 'w') as f:
+        f.write("Edited by hand")
+
+    writer = FileWriter(temp_dir, overwrite=True)
+    writer.write_ticket('TEST-123', "Same content")
+    with open(filepath, 'r') as f:
+        assert f.read() == "Same content"
+
+
+def test_filename_format_separators_stay_flat(temp_dir):
+    """Test that separators in formatted filenames never create subdirectories."""
+    writer = FileWriter(temp_dir, filename_format="{key}/{summary}.md")
+    filepath = writer.write_ticket('TEST-123', 'content', {'summary': 'a/b\\c'})
+
+    assert os.path.dirname(filepath) == temp_dir
+    assert os.listdir(temp_dir) == ['TEST-123_a_b_c.md']
+
+
+def test_overwrite_skips_unchanged_ticket_across_runs(temp_dir, monkeypatch, mock_config):
+    """Test that converter output differing only in its footer is not rewritten."""
+    class Clock(datetime):
+        current = None
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    def converter_started_at(when):
+        Clock.current = when
+        with monkeypatch.context() as m:
+            m.setattr(markdown_converter, 'datetime', Clock)
+            return MarkdownConverter(mock_config)
+
+    ticket = {'key': 'TEST-123', 'summary': 'Test Issue', 'description': 'Some *bold* text'}
+    first = converter_started_at(datetime(2024, 1, 15, 10, 0, 0)).convert(ticket)
+    second = converter_started_at(datetime(2024, 1, 15, 10, 0, 2)).convert(ticket)
+    assert first != second
+
+    writer = FileWriter(temp_dir, overwrite=True)
+    filepath = writer.write_ticket('TEST-123', first)
+    writer.close()
+    mtime = os.stat(filepath).st_mtime_ns
+
+    writer = FileWriter(temp_dir, overwrite=True)
+    writer.write_ticket('TEST-123', second)
+    assert os.stat(filepath).st_mtime_ns == mtime
+
+    ticket['summary'] = 'Renamed Issue'
+    writer.write_ticket('TEST-123', converter_started_at(datetime(2024, 1, 15, 10, 0, 4)).convert(ticket))
+    with open(filepath, 'r') as f:
+        assert '# [TEST-123] Renamed Issue' in f.read()
+
+
+def test_failed_write_leaves_no_temp_file(writer, temp_dir, monkeypatch):
+    """Test that a write failing at the rename removes its temporary file."""
+    def fail_replace(src, dst):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(os, 'replace', fail_replace)
+
+    with pytest.raises(FileWriteError):
+        writer.write_ticket('TEST-123', "Content")
+
+    assert os.listdir(temp_dir) == []
+
+
+def test_written_file_follows_umask(writer, temp_dir):
+    """Test that written files get the permissions the umask allows."""
+    umask = os.umask(0o027)
+    try:
+        filepath = writer.write_ticket('TEST-123', "Content")
+    finally:
+        os.umask(umask)
+
+    assert os.stat(filepath).st_mode & 0o777 == 0o640
@@ -0,0 +1,202 @@
+"""Tests for image downloader."""
+
+import os
+import shutil
+import tempfile
+import pytest
+import requests
+from jira_to_markdown.image_downloader import ImageDownloader
+
+
+class FakeResponse:
+    """Just enough of a requests response for _download_image."""
+
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+    def iter_content(self, chunk_size=1):
+        yield self.body
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Serves images by URL, honoring If-None-Match; records every request."""
+
+    def __init__(self, images):
+        self.images = images
+        self.requests = []
+        self.auths = []
+
+    def get(self, url, headers=None, auth=None, **kwargs):
+        headers = headers or {}
+        self.requests.append((url, headers))
+        self.auths.append(auth)
+        if url not in self.images:
+            return FakeResponse(404)
+        etag = f'"{len(self.images[url])}"'
+        if headers.get('If-None-Match') == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.images[url], {'ETag': etag})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def output_dir():
+    """Create a temporary output directory for testing."""
+    temp_path = tempfile.mkdtemp()
+    yield temp_path
+    shutil.rmtree(temp_path)
+
+
+def make_downloader(output_dir, session):
+    downloader = ImageDownloader(
+        output_dir, os.path.join(output_dir, 'images'), 'https://test.atlassian.net'
+    )
+    downloader.session = session
+    downloader.jira_session = session
+    return downloader
+
+
+def write_markdown(output_dir, name, content):
+    with open(os.path.join(output_dir, name), 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def read_markdown(output_dir, name):
+    with open(os.path.join(output_dir, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_rewrite_repeated_and_overlapping_urls(output_dir):
+    """Test that every reference is rewritten once, in place, in a single pass."""
+    session = FakeSession({
+        'https://ext.example/a.png': b'png-a',
+        'https://ext.example/a.png?size=2': b'png-a-large',
+    })
+    write_markdown(output_dir, 'PROJ-1.md', (
+        "![a](https://ext.example/a.png) first\n"
+        "![a](https://ext.example/a.png) repeated\n"
+        "![other alt](https://ext.example/a.png) same URL\n"
+        "![b](https://ext.example/a.png?size=2) longer URL\n"
+        "![gone](https://ext.example/missing.png) failed\n"
+        "![local](images/local.png) local\n"
+    ))
+
+    with make_downloader(output_dir, session) as downloader:
+        result = downloader.process_directory()['PROJ-1.md']
+
+    assert read_markdown(output_dir, 'PROJ-1.md') == (
+        "![a](images/PROJ-1-a.png) first\n"
+        "![a](images/PROJ-1-a.png) repeated\n"
+        "![other alt](images/PROJ-1-a.png) same URL\n"
+        "![b](images/PROJ-1-a-1.png) longer URL\n"
+        "![gone](https://ext.example/missing.png) failed\n"
+        "![local](images/local.png) local\n"
+    )
+    assert (result['images_found'], result['images_downloaded'],
+            result['images_failed'], result['images_skipped']) == (5, 4, 1, 1)
+    assert len(session.requests) == 3
+
+
+def test_download_cache_revalidates_across_runs(output_dir):
+    """Test that a later run reuses cached images, revalidating external ones."""
+    external = 'https://ext.example/a.png'
+    attachment = 'https://test.atlassian.net/secure/attachment/1/j.png'
+    content = f"![a]({external})\n![j]({attachment})\n"
+    rewritten = "![a](images/PROJ-1-a.png)\n![j](images/PROJ-1-j.png)\n"
+    images_dir = os.path.join(output_dir, 'images')
+
+    write_markdown(output_dir, 'PROJ-1.md', content)
+    with make_downloader(output_dir, FakeSession({external: b'png-a', attachment: b'png-j'})) as downloader:
+        downloader.process_directory()
+    assert read_markdown(output_dir, 'PROJ-1.md') == rewritten
+
+    # Re-exported ticket, unchanged image: one conditional request, answered 304
+    write_markdown(output_dir, 'PROJ-1.md', content)
+    session = FakeSession({external: b'png-a', attachment: b'png-j'})
+    with make_downloader(output_dir, session) as downloader:
+        downloader.process_directory()
+
+    assert session.requests == [(external, {'User-Agent': ImageDownloader.USER_AGENT,
+                                            'If-None-Match': '"5"'})]
+    assert read_markdown(output_dir, 'PROJ-1.md') == rewritten
+    assert sorted(os.listdir(images_dir)) == [
+        ImageDownloader.CACHE_FILENAME, 'PROJ-1-a.png', 'PROJ-1-j.png'
+    ]
+
+    # Changed image: downloaded again into the same file
+    write_markdown(output_dir, 'PROJ-1.md', content)
+    with make_downloader(output_dir, FakeSession({external: b'png-a-v2', attachment: b'png-j'})) as downloader:
+        downloader.process_directory()
+
+    assert read_markdown(output_dir, 'PROJ-1.md') == rewritten
+    with open(os.path.join(images_dir, 'PROJ-1-a.png'), 'rb') as f:
+        assert f.read() == b'png-a-v2'
+
+
+def test_missing_output_directory_finds_nothing(output_dir):
+    """Test that a missing output directory is processed as an empty one."""
+    missing = os.path.join(output_dir, 'missing')
+    downloader = ImageDownloader(missing, os.path.join(output_dir, 'images'), 'https://test.atlassian.net')
+
+    with downloader:
+        assert downloader.find_markdown_files() == []
+        assert downloader.collect_remote_images(downloader.find_markdown_files()) == {}
+        assert downloader.process_directory() == {}
+
+
+def test_downloaded_files_follow_umask(output_dir):
+    """Test that images and rewritten markdown get the permissions the umask allows."""
+    url = 'https://ext.example/a.png'
+    write_markdown(output_dir, 'PROJ-1.md', f"![a]({url})\n")
+
+    umask = os.umask(0o027)
+    try:
+        with make_downloader(output_dir, FakeSession({url: b'png-a'})) as downloader:
+            downloader.process_directory()
+    finally:
+        os.umask(umask)
+
+    for path in (os.path.join(output_dir, 'images', 'PROJ-1-a.png'),
+                 os.path.join(output_dir, 'PROJ-1.md')):
+        assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+def test_credentials_only_go_to_jira_host(output_dir):
+    """Test that a JIRA-like attachment path on another host is fetched anonymously."""
+    foreign = 'https://evil.example/rest/api/2/attachment/content/1'
+    attachment = 'https://test.atlassian.net/rest/api/2/attachment/content/2'
+    write_markdown(output_dir, 'PROJ-1.md', f"![f]({foreign})\n![j]({attachment})\n")
+    session = FakeSession({foreign: b'png-f', attachment: b'png-j'})
+    jira_session = FakeSession({foreign: b'png-f', attachment: b'png-j'})
+
+    with make_downloader(output_dir, session) as downloader:
+        downloader.jira_session = jira_session
+        downloader.process_directory()
+
+    assert [url for url, _ in session.requests] == [foreign]
+    assert session.auths == [None]
+    assert [url for url, _ in jira_session.requests] == [attachment]
+
+    # Without a JIRA session, basic auth is still only sent to the JIRA host
+    write_markdown(output_dir, 'PROJ-2.md', f"![f]({foreign}?v=2)\n![j]({attachment}?v=2)\n")
+    session = FakeSession({f'{foreign}?v=2': b'png-f', f'{attachment}?v=2': b'png-j'})
+    downloader = make_downloader(output_dir, session)
+    downloader.jira_session = None
+    downloader.jira_username, downloader.jira_api_token = 'user', 'token'
+    with downloader:
+        downloader.process_directory()
+
+    assert dict(zip((url for url, _ in session.requests), session.auths)) == {
+        f'{foreign}?v=2': None, f'{attachment}?v=2': ('user', 'token'),
+    }
@@ -0,0 +1,39 @@
+"""Tests for JIRA client search pagination."""
+
+from jira_to_markdown.jira_client import JiraClient
+
+
+def make_client(fake_jira):
+    client = JiraClient('https://test.atlassian.net', 'user', 'token')
+    client._jira = fake_jira
+    return client
+
+
+def test_iter_search_pages_returns_every_issue(paged_jira):
+    """Test that streaming pages through all results on Cloud and Server."""
+    client = make_client(paged_jira)
+
+    pages = list(client.iter_search_pages('project = PROJ', page_size=50))
+
+    assert [len(page) for page in pages] == [50, 50, 20]
+    assert [issue for page in pages for issue in page] == paged_jira.issues
+    assert pages[0].total == 120
+
+
+def test_iter_search_pages_cloud_respects_max_results(cloud_jira):
+    """Test that the overall limit caps the last token-paged request."""
+    client = make_client(cloud_jira)
+
+    pages = list(client.iter_search_pages('project = PROJ', page_size=50, max_results=70))
+
+    assert sum(len(page) for page in pages) == 70
+    assert cloud_jira.requests == [0, 50]
+
+
+def test_search_all_issues_returns_every_issue(paged_jira):
+    """Test that all pages are fetched on Cloud and Server, in order."""
+    client = make_client(paged_jira)
+
+    issues = client.search_all_issues('project = PROJ', batch_size=50)
+
+    assert issues == paged_jira.issues
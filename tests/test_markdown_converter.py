@@ -1,51 +1,14 @@
 """Tests for markdown converter."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import pytest
 from jira_to_markdown.markdown_converter import MarkdownConverter
 
 
-class MockConfig:
-    """Mock config for testing."""
-
-    def __init__(self):
-        self._config = {
-            'markdown': {
-                'include_metadata_table': True,
-                'include_comments': True,
-                'include_attachments': True,
-                'include_subtasks': True,
-                'include_links': True,
-                'date_format': '%Y-%m-%d %H:%M:%S',
-                'convert_markup': True
-            },
-            'jira': {
-                'url': 'https://test.atlassian.net'
-            }
-        }
-
-    def get(self, key, default=None):
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-        return value
-
-    @property
-    def jira_url(self):
-        return 'https://test.atlassian.net'
-
-
 @pytest.fixture
-def converter():
+def converter(mock_config):
     """Create a markdown converter with mock config."""
-    config = MockConfig()
-    return MarkdownConverter(config)
+    return MarkdownConverter(mock_config)
 
 
 @pytest.fixture
@@ -141,6 +104,53 @@ def test_convert_jira_markup_link(converter):
     assert '[Example](https://example.com)' in result
 
 
+def test_convert_jira_markup_mixed(converter):
+    """Test that mixed markup converts exactly as the original per-call regexes did."""
+    text = (
+        '{code:java}\nint *a* = b_c_d;\n{code}\n'
+        'Then *bold*, _it_, -strike-, +under+, {{mono}} and [Docs|https://d.example/a_b].\n'
+        '- item one\n- item _two_\n'
+        '{quote}quoted *line*\nsecond{quote}\n'
+        '{noformat}\nraw -x- text\n{noformat}\n'
+        '!shot~~1.png|width=300! and !other.png!'
+    )
+    attachments = [{'filename': 'shot-1.png', 'url': 'https://x/att/shot-1.png'}]
+
+    # Later passes also apply inside code blocks; that is existing behavior
+    assert converter._convert_jira_markup(text, attachments) == (
+        '```java\n\nint **a** = b*c*d;\n\n```\n'
+        'Then **bold**, *it*, ~~strike~~, *under*, `mono` and [Docs](https://d.example/a_b).\n'
+        '* item one\n* item *two*\n'
+        '> quoted **line**\n> second\n'
+        '```\n\nraw ~~x~~ text\n\n```\n'
+        '![shot-1.png](https://x/att/shot-1.png) and ![other.png](other.png)'
+    )
+
+
+def test_convert_jira_markup_headers(converter):
+    """Test that every header level converts in one pass and nothing else does."""
+    text = 'h1. Title\nh3. Sub *bold* and _it_\nh6. Deep\nh7. Not a header\nxh2. inline'
+    assert converter._convert_jira_markup(text) == (
+        '# Title\n### Sub **bold** and *it*\n###### Deep\nh7. Not a header\nxh2. inline'
+    )
+
+
+@pytest.mark.parametrize('text', [
+    'plain text with no markup at all',
+    'a - b and c * d, 3 + 4 = 7. done',
+])
+def test_convert_jira_markup_leaves_plain_text(converter, text):
+    """Test that text with markup characters but no markup comes back unchanged."""
+    assert converter._convert_jira_markup(text) == text
+
+
+def test_convert_jira_markup_passes_cascade(converter):
+    """Test that each pass sees the output of the passes before it."""
+    # Quoting runs first, so the quoted lines no longer start with a bullet
+    assert converter._convert_jira_markup('{quote}- first\n- second{quote}') == '> - first\n> - second'
+    assert converter._convert_jira_markup('{{a_b_c}} and -{{x}}-') == '`a*b*c` and ~~`x`~~'
+
+
 def test_render_metadata_table(converter, sample_ticket_data):
     """Test metadata table rendering."""
     table = converter._render_metadata_table(sample_ticket_data)
@@ -153,6 +163,17 @@ def test_render_metadata_table(converter, sample_ticket_data):
     assert 'bug, critical' in table
 
 
+def test_render_metadata_table_escapes_cells(converter, sample_ticket_data):
+    """Test that pipes and line breaks in values can't break a table row."""
+    sample_ticket_data['status'] = 'Done | Closed'
+    sample_ticket_data['resolution'] = 'Fixed\nin 2.0\nand | 2.1'
+
+    lines = converter._render_metadata_table(sample_ticket_data).split('\n')
+
+    assert '| **Status** | Done \\| Closed |' in lines
+    assert '| **Resolution** | Fixed in 2.0 and \\| 2.1 |' in lines
+
+
 def test_render_comments(converter, sample_ticket_data):
     """Test comments rendering."""
     comments = converter._render_comments(sample_ticket_data['comments'])
@@ -179,3 +200,15 @@ def test_format_size(converter):
     assert converter._format_size(1024) == '1.0 KB'
     assert converter._format_size(1024 * 1024) == '1.0 MB'
     assert converter._format_size(1024 * 1024 * 1024) == '1.0 GB'
+
+
+def test_format_date_cache_keeps_offsets_apart(converter):
+    """Test that equal instants in different zones keep their own wall-clock time."""
+    utc = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    cet = datetime(2024, 1, 15, 11, 0, tzinfo=timezone(timedelta(hours=1)))
+    assert utc == cet
+
+    assert converter._format_date(utc, '%H:%M') == '10:00'
+    assert converter._format_date(cet, '%H:%M') == '11:00'
+    assert converter._format_date(utc, '%Y-%m-%d') == '2024-01-15'
+    assert converter._format_date('2024-01-15', '%H:%M') == '2024-01-15'
@@ -0,0 +1,123 @@
+"""Tests for ticket fetcher."""
+
+from types import SimpleNamespace
+from jira_to_markdown.jira_client import JiraClient, JiraConnectionError, TicketNotFoundError
+from jira_to_markdown.ticket_fetcher import TicketFetcher
+
+
+def make_fetcher(fake_jira):
+    client = JiraClient('https://test.atlassian.net', 'user', 'token')
+    client._jira = fake_jira
+    fetcher = TicketFetcher(client)
+    fetcher._extract_ticket_data = lambda issue: {'key': issue}
+    return fetcher
+
+
+def test_stream_by_jql_follows_every_page(cloud_jira):
+    """Test that streaming returns all tickets across token-paged results."""
+    total, tickets = make_fetcher(cloud_jira).stream_by_jql('project = PROJ')
+
+    assert total == 120
+    assert [ticket['key'] for ticket in tickets] == cloud_jira.issues
+
+
+def test_stream_by_jql_prefetches_next_page(cloud_jira):
+    """Test that page N+1 is requested while page N is still being consumed."""
+    _, tickets = make_fetcher(cloud_jira).stream_by_jql('project = PROJ')
+
+    # Only the first ticket of the first page has been taken so far
+    assert next(tickets)['key'] == 'PROJ-0'
+    assert cloud_jira.was_requested(50)
+    assert 100 not in cloud_jira.requested
+
+    for _ in range(50):
+        next(tickets)
+    assert cloud_jira.was_requested(100)
+
+
+def test_parse_date_keeps_dateutil_time_zones(cloud_jira):
+    """Test that parsed JIRA dates render their zone the way dateutil's tzinfo does."""
+    fetcher = make_fetcher(cloud_jira)
+
+    utc = fetcher._parse_date('2024-01-15T10:30:00.000+0000')
+    offset = fetcher._parse_date('2024-01-15T10:30:00.000+0100')
+
+    assert utc.strftime('%H:%M %Z') == '10:30 UTC'
+    assert offset.strftime('%H:%M %z|%Z') == '10:30 +0100|'
+    assert fetcher._parse_date('not a date') is None
+    assert fetcher._parse_date(None) is None
+
+
+class KeyedJira:
+    """Fake JiraClient knowing a fixed set of tickets; records every call."""
+
+    def __init__(self, keys):
+        self.keys = set(keys)
+        self.searches = []
+        self.fetched = []
+
+    def search_issues(self, jql, max_results=100):
+        self.searches.append(jql)
+        keys = jql[len('issuekey in ('):-1].split(', ')
+        # Like JIRA, reject the whole search when any key doesn't exist
+        if not self.keys.issuperset(keys):
+            raise JiraConnectionError(f"Search failed: {jql}")
+        return [SimpleNamespace(key=key) for key in keys][:max_results]
+
+    def get_issue(self, key):
+        self.fetched.append(key)
+        if key.upper() not in self.keys:
+            raise TicketNotFoundError(f"Ticket {key} not found")
+        return SimpleNamespace(key=key.upper())
+
+
+def make_bulk_fetcher(keys):
+    fetcher = TicketFetcher(KeyedJira(keys))
+    fetcher._extract_ticket_data = lambda issue: {'key': issue.key}
+    return fetcher
+
+
+def test_fetch_bulk_keeps_requested_order():
+    """Test that tickets come back in the order asked, duplicates and case included."""
+    fetcher = make_bulk_fetcher(['PROJ-1', 'PROJ-2', 'PROJ-3'])
+
+    tickets = fetcher.fetch_bulk(['PROJ-3', 'proj-1', 'PROJ-2', 'PROJ-1'])
+
+    assert [ticket['key'] for ticket in tickets] == ['PROJ-3', 'PROJ-1', 'PROJ-2', 'PROJ-1']
+    assert fetcher.jira_client.searches == ['issuekey in (PROJ-3, PROJ-1, PROJ-2)']
+    assert fetcher.jira_client.fetched == []
+
+
+def test_fetch_bulk_falls_back_to_single_fetches():
+    """Test that a batch with an unknown key is fetched key by key, dropping failures."""
+    fetcher = make_bulk_fetcher(['PROJ-1', 'PROJ-2'])
+
+    tickets = fetcher.fetch_bulk(['PROJ-1', 'PROJ-404', 'proj-2', 'PROJ-2'], max_workers=1)
+
+    assert [ticket['key'] for ticket in tickets] == ['PROJ-1', 'PROJ-2', 'PROJ-2']
+    assert fetcher.jira_client.fetched == ['PROJ-1', 'PROJ-404', 'PROJ-2']
+
+
+def test_fetch_bulk_keeps_odd_keys_out_of_jql():
+    """Test that keys not shaped like ticket keys are only ever fetched on their own."""
+    fetcher = make_bulk_fetcher(['PROJ-1'])
+
+    tickets = fetcher.fetch_bulk(['PROJ-1', 'PROJ-1) OR (project = SECRET'])
+
+    assert [ticket['key'] for ticket in tickets] == ['PROJ-1']
+    assert fetcher.jira_client.searches == ['issuekey in (PROJ-1)']
+    assert fetcher.jira_client.fetched == ['PROJ-1) OR (PROJECT = SECRET']
+
+
+def test_fetch_bulk_splits_batches():
+    """Test that searches carry at most BULK_BATCH_SIZE keys each."""
+    keys = [f"PROJ-{i}" for i in range(TicketFetcher.BULK_BATCH_SIZE * 2 + 1)]
+    fetcher = make_bulk_fetcher(keys)
+
+    tickets = fetcher.fetch_bulk(keys)
+
+    assert [ticket['key'] for ticket in tickets] == keys
+    assert sorted((len(jql.split(', ')) for jql in fetcher.jira_client.searches), reverse=True) == [
+        TicketFetcher.BULK_BATCH_SIZE, TicketFetcher.BULK_BATCH_SIZE, 1
+    ]
+    assert fetcher.jira_client.fetched == []